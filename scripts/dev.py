@@ -45,6 +45,14 @@ def test_fast():
     return run_cmd('pytest -m "not slow"', "Running fast tests")
 
 
+def test_parallel():
+    """Run integration tests across CPU cores, one test file per worker."""
+    return run_cmd(
+        'pytest -m integration -n auto --dist=loadfile --maxfail=5 --timeout=30',
+        "Running integration tests in parallel"
+    )
+
+
 def test_coverage():
     """Run tests with coverage."""
     return run_cmd("pytest --cov=src --cov-report=html", "Running tests with coverage")
@@ -98,7 +106,7 @@ def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(description="Discord Publish Bot development tools")
     parser.add_argument("command", choices=[
-        "dev", "test", "test-fast", "test-cov", 
+        "dev", "test", "test-fast", "test-parallel", "test-cov", 
         "format", "lint", "types", "install", "build"
     ], help="Command to run")
     
@@ -108,6 +116,7 @@ def main():
         "dev": dev_server,
         "test": test_all,
         "test-fast": test_fast,
+        "test-parallel": test_parallel,
         "test-cov": test_coverage,
         "format": format_code,
         "lint": lint_all,
@@ -38,7 +38,7 @@ def get_github_client() -> GitHubClient:
         
         try:
             _github_client = GitHubClient(
-                token=settings.github.token,
+                token=settings.github.token.get_secret_value(),
                 repository=settings.github.repository
             )
             logger.info("GitHub client initialized")
@@ -138,7 +138,7 @@ def verify_api_key(
         HTTPException: If authentication fails
     """
     settings = get_settings()
-    expected_key = settings.api.key
+    expected_key = settings.api.key.get_secret_value()
     
     # Check Authorization header (Bearer token)
     if authorization:
@@ -5,25 +5,30 @@ Uses Pydantic for validation and type safety.
 Consolidates all configuration concerns into a single, well-structured system.
 """
 
+import functools
 import os
+import re
 from typing import Optional, Literal
 from pathlib import Path
 
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, SecretStr, validator, ConfigDict
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Ed25519 public key as issued by the Discord developer portal
+_PUBLIC_KEY_PATTERN = re.compile(r'[0-9a-fA-F]{64}')
+
 
 class DiscordSettings(BaseModel):
     """Discord-specific configuration settings."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
     # Bot Authentication
-    bot_token: str = Field(..., description="Discord bot token")
+    bot_token: SecretStr = Field(..., description="Discord bot token")
     
     # HTTP Interactions (for serverless deployment)
     application_id: Optional[str] = Field(None, description="Discord application ID for HTTP interactions")
@@ -37,7 +42,7 @@ class DiscordSettings(BaseModel):
     
     @validator('bot_token')
     def validate_bot_token(cls, v):
-        if not v or len(v) < 50:  # Discord tokens are typically 70+ chars
+        if len(v.get_secret_value()) < 50:  # Discord tokens are typically 70+ chars
             raise ValueError('Invalid Discord bot token format')
         return v
     
@@ -52,20 +57,28 @@ class DiscordSettings(BaseModel):
         if v is not None and not v.isdigit():
             raise ValueError('Discord application ID must be numeric')
         return v
+    
+    @validator('public_key')
+    def validate_public_key(cls, v):
+        if not v:
+            return None  # HTTP interactions not configured
+        if not _PUBLIC_KEY_PATTERN.fullmatch(v):
+            raise ValueError('Discord public key must be 64 hex characters')
+        return v.lower()
 
 
 class GitHubSettings(BaseModel):
     """GitHub-specific configuration settings."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
-    token: str = Field(..., description="GitHub personal access token")
+    token: SecretStr = Field(..., description="GitHub personal access token")
     repository: str = Field(..., description="GitHub repository in format 'owner/repo'")
     branch: str = Field(default="main", description="Target branch for commits")
     
     @validator('token')
     def validate_token(cls, v):
-        if not v.startswith(('ghp_', 'github_pat_', 'gho_', 'ghu_')):
+        if not v.get_secret_value().startswith(('ghp_', 'github_pat_', 'gho_', 'ghu_')):
             raise ValueError('Invalid GitHub token format')
         return v
     
@@ -89,16 +102,16 @@ class GitHubSettings(BaseModel):
 class APISettings(BaseModel):
     """API-specific configuration settings."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
-    key: str = Field(..., description="API key for authentication")
+    key: SecretStr = Field(..., description="API key for authentication")
     host: str = Field(default="0.0.0.0", description="API host address")
     port: int = Field(default=8000, description="API port number")
     endpoint: Optional[str] = Field(None, description="External API endpoint URL")
     
     @validator('key')
     def validate_key(cls, v):
-        if len(v) < 16:
+        if len(v.get_secret_value()) < 16:
             raise ValueError('API key must be at least 16 characters')
         return v
     
@@ -112,7 +125,7 @@ class APISettings(BaseModel):
 class PublishingSettings(BaseModel):
     """Publishing-specific configuration settings."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
     site_base_url: Optional[str] = Field(None, description="Base URL for the published site")
     default_author: Optional[str] = Field(None, description="Default author for posts")
@@ -127,7 +140,7 @@ class PublishingSettings(BaseModel):
 class AzureStorageSettings(BaseModel):
     """Azure Storage configuration for permanent media hosting."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
     # Storage Account Configuration
     account_name: Optional[str] = Field(None, description="Azure Storage Account name")
@@ -176,7 +189,7 @@ class AzureStorageSettings(BaseModel):
 class LinodeStorageSettings(BaseModel):
     """Linode Object Storage configuration for permanent media hosting."""
     
-    model_config = ConfigDict(extra='ignore')
+    model_config = ConfigDict(extra='ignore', frozen=True)
     
     # Linode Object Storage Credentials (S3-compatible)
     access_key_id: Optional[str] = Field(None, description="Linode Object Storage access key ID")
@@ -232,7 +245,8 @@ class AppSettings(BaseSettings):
         env_file='.env',
         env_file_encoding='utf-8',
         case_sensitive=False,
-        extra='ignore'  # Ignore extra environment variables
+        extra='ignore',  # Ignore extra environment variables
+        frozen=True  # Settings are read-only once loaded
     )
     
     # Application Metadata
@@ -371,23 +385,16 @@ class AppSettings(BaseSettings):
         )
 
 
-# Global settings instance
-settings: Optional[AppSettings] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """
     Get global settings instance.
     
-    Creates settings from environment if not already initialized.
+    Creates settings from environment on first call and caches the result.
     """
-    global settings
-    if settings is None:
-        settings = AppSettings.from_env()
-    return settings
+    return AppSettings.from_env()
 
 
 def reset_settings() -> None:
-    """Reset global settings instance (useful for testing)."""
-    global settings
-    settings = None
+    """Reset global settings instance (useful for testing); clears the get_settings cache."""
+    get_settings.cache_clear()
@@ -57,6 +57,8 @@ class DiscordBot(commands.Bot):
 
         self.settings = settings
         self.post_handler = post_handler
+        # discord.py exposes user IDs as ints; parse the configured ID once
+        self.authorized_user_id = int(settings.authorized_user_id)
         
         logger.info("Initialized Discord WebSocket bot")
 
@@ -101,13 +103,13 @@ class DiscordBot(commands.Bot):
 
     def is_authorized(self, user_id: int) -> bool:
         """Check if user is authorized to use the bot."""
-        return str(user_id) == self.settings.discord.authorized_user_id
+        return user_id == self.authorized_user_id
 
     async def start_bot(self) -> None:
         """Start the bot with error handling."""
         try:
             logger.info("Starting Discord WebSocket bot...")
-            await self.start(self.settings.bot_token)
+            await self.start(self.settings.bot_token.get_secret_value())
         except discord.LoginFailure as e:
             logger.error(f"Discord login failed: {e}")
             raise DiscordAuthenticationError(f"Discord login failed: {e}")
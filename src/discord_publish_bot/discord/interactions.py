@@ -5,9 +5,11 @@ Handles Discord interactions via HTTP webhooks instead of WebSocket gateway.
 This enables serverless deployment with scale-to-zero capabilities.
 """
 
+import functools
 import logging
 import os
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
 from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError
 
@@ -17,7 +19,8 @@ from ..shared import (
     DiscordCommandError,
     DiscordModalError,
     PostType,
-    PostData
+    PostData,
+    POST_TYPE_VALUES
 )
 
 logger = logging.getLogger(__name__)
@@ -51,6 +54,10 @@ class ComponentType:
     TEXT_INPUT = 4
 
 
+# Ed25519 signatures are 64 bytes, sent hex-encoded
+_SIGNATURE_PATTERN = re.compile(r'[0-9a-fA-F]{128}')
+
+
 class DiscordInteractionsHandler:
     """
     Discord interactions handler for HTTP webhooks.
@@ -71,7 +78,7 @@ class DiscordInteractionsHandler:
         if not settings.discord.public_key:
             raise ValueError("Discord public key is required for HTTP interactions")
         
-        self.verify_key = VerifyKey(bytes.fromhex(settings.discord.public_key))
+        self.verify_key = _verify_key(settings.discord.public_key)
         logger.info("Initialized Discord interactions handler")
     
     def verify_signature(self, signature: str, timestamp: str, body: bytes) -> bool:
@@ -90,15 +97,14 @@ class DiscordInteractionsHandler:
             DiscordSignatureError: If signature verification fails
         """
         try:
-            message = f"{timestamp}{body.decode('utf-8')}"
-            self.verify_key.verify(message.encode(), bytes.fromhex(signature))
-            return True
-        except BadSignatureError as e:
-            logger.error(f"Discord signature verification failed: {e}")
-            raise DiscordSignatureError("Invalid Discord signature")
+            if verify_signature(signature, timestamp, body, self.settings.discord.public_key):
+                return True
         except Exception as e:
             logger.error(f"Signature verification error: {e}")
             raise DiscordSignatureError(f"Signature verification error: {e}")
+        
+        logger.error("Discord signature verification failed")
+        raise DiscordSignatureError("Invalid Discord signature")
     
     async def handle_interaction(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -113,13 +119,11 @@ class DiscordInteractionsHandler:
         Raises:
             DiscordCommandError: If command processing fails
         """
+        interaction_type = interaction.get("type")
+        if interaction_type == InteractionType.PING:
+            return {"type": InteractionResponseType.PONG}
+        
         try:
-            interaction_type = interaction.get("type")
-            
-            if interaction_type == InteractionType.PING:
-                logger.debug("Handling ping interaction")
-                return {"type": InteractionResponseType.PONG}
-            
             if interaction_type == InteractionType.APPLICATION_COMMAND:
                 return await self._handle_application_command(interaction)
             
@@ -276,133 +280,37 @@ class DiscordInteractionsHandler:
             
         # Note: alt_text parameter handling is primarily supported in WebSocket bot
         # HTTP interactions have limitations for passing command parameters through modals
-            
-        modal = {
-            "custom_id": custom_id,
-            "title": f"Create {post_type.value.title()} Post",
-            "components": []
-        }
         
-        # Common fields for all post types
-        components = [
-            {
-                "type": ComponentType.ACTION_ROW,
-                "components": [{
-                    "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "title",
-                    "label": "Title",
-                    "style": 1,  # Short
-                    "placeholder": "Enter post title...",
-                    "required": True,
-                    "max_length": 200
-                }]
-            },
-            {
-                "type": ComponentType.ACTION_ROW,
-                "components": [{
-                    "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "content",
-                    "label": "Content",
-                    "style": 2,  # Paragraph
-                    "placeholder": "Enter post content...",
-                    "required": True,
-                    "max_length": 4000
-                }]
-            },
-            {
-                "type": ComponentType.ACTION_ROW,
-                "components": [{
-                    "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "tags",
-                    "label": "Tags (comma-separated)",
-                    "style": 1,  # Short
-                    "placeholder": "tag1, tag2, tag3",
-                    "required": False,
-                    "max_length": 200
-                }]
-            },
-            {
-                "type": ComponentType.ACTION_ROW,
-                "components": [{
-                    "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "slug",
-                    "label": "Custom Slug (optional)",
-                    "style": 1,  # Short
-                    "placeholder": "Leave blank to auto-generate from title",
-                    "required": False,
-                    "max_length": 80
-                }]
-            }
-        ]
+        # Rows are built fresh per call, so callers can edit them freely
+        components = _modal_component_rows(post_type.value)
         
-        # Type-specific fields
-        if post_type == PostType.RESPONSE:
-            components.append({
-                "type": ComponentType.ACTION_ROW,
-                "components": [{
-                    "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "target_url",
-                    "label": "Target URL",
-                    "style": 1,  # Short
-                    "placeholder": "https://example.com/original-post",
-                    "required": True,
-                    "max_length": 500
-                }]
-            })
-        
-        elif post_type == PostType.BOOKMARK:
-            components.append({
+        # Media posts with an attachment pre-fill the media URL, which varies per request
+        if post_type == PostType.MEDIA and attachment_data:
+            attachment_url = attachment_data.get("url")
+            attachment_filename = attachment_data.get("filename", "file")
+            
+            components[-1] = {
                 "type": ComponentType.ACTION_ROW,
                 "components": [{
                     "type": ComponentType.TEXT_INPUT,
-                    "custom_id": "target_url",
-                    "label": "Bookmark URL",
+                    "custom_id": "media_url",
+                    "label": "Media URL",
                     "style": 1,  # Short
-                    "placeholder": "https://example.com/article",
-                    "required": True,
+                    "placeholder": f"Using uploaded file: {attachment_filename}",
+                    "value": attachment_url,  # Pre-fill with attachment URL
+                    "required": False,
                     "max_length": 500
                 }]
-            })
+            }
         
-        elif post_type == PostType.MEDIA:
-            # Handle attachment data for media posts
-            if attachment_data:
-                attachment_url = attachment_data.get("url")
-                attachment_filename = attachment_data.get("filename", "file")
-                
-                components.append({
-                    "type": ComponentType.ACTION_ROW,
-                    "components": [{
-                        "type": ComponentType.TEXT_INPUT,
-                        "custom_id": "media_url",
-                        "label": "Media URL",
-                        "style": 1,  # Short
-                        "placeholder": f"Using uploaded file: {attachment_filename}",
-                        "value": attachment_url,  # Pre-fill with attachment URL
-                        "required": False,
-                        "max_length": 500
-                    }]
-                })
-            else:
-                # Standard URL input when no attachment
-                components.append({
-                    "type": ComponentType.ACTION_ROW,
-                    "components": [{
-                        "type": ComponentType.TEXT_INPUT,
-                        "custom_id": "media_url",
-                        "label": "Media URL",
-                        "style": 1,  # Short
-                        "placeholder": "https://example.com/image.jpg",
-                        "required": False,
-                        "max_length": 500
-                    }]
-                })
-            
-            # Note: Alt text is now handled via command parameter only (Phase 2 simplification)
-            # Modal consistently shows: Title, Content, Tags, Custom Slug, Media URL (5 fields)
+        # Note: Alt text is now handled via command parameter only (Phase 2 simplification)
+        # Modal consistently shows: Title, Content, Tags, Custom Slug, Media URL (5 fields)
         
-        modal["components"] = components
-        return modal
+        return {
+            "custom_id": custom_id,
+            "title": f"Create {post_type.value.title()} Post",
+            "components": components
+        }
     
     def _handle_modal_submit(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
         """Handle modal submission for post creation."""
@@ -430,9 +338,7 @@ class DiscordInteractionsHandler:
             # Extract post type and response type from custom_id
             custom_id_parts = custom_id.replace("post_modal_", "").split("_")
             post_type_str = custom_id_parts[0]
-            try:
-                post_type = PostType(post_type_str)
-            except ValueError:
+            if post_type_str not in POST_TYPE_VALUES:
                 raise DiscordModalError(f"Invalid post type: {post_type_str}", modal_id=custom_id)
             
             # Extract form data
@@ -522,19 +428,169 @@ class DiscordInteractionsHandler:
 
 def extract_component_data(components: list) -> Dict[str, str]:
     """Extract data from Discord modal components."""
-    data = {}
-    
-    for action_row in components:
-        for component in action_row["components"]:
-            if component["type"] == ComponentType.TEXT_INPUT:
-                custom_id = component["custom_id"]
-                value = component.get("value", "")
-                data[custom_id] = value
-    
-    return data
+    return {
+        component["custom_id"]: component.get("value", "")
+        for action_row in components
+        for component in action_row["components"]
+        if component["type"] == ComponentType.TEXT_INPUT
+    }
 
 
 def extract_component_value(components: list, field_name: str) -> Optional[str]:
     """Extract a specific field value from Discord modal components."""
-    data = extract_component_data(components)
-    return data.get(field_name)
+    return next(
+        (
+            component.get("value", "")
+            for action_row in components
+            for component in action_row["components"]
+            if component["type"] == ComponentType.TEXT_INPUT and component["custom_id"] == field_name
+        ),
+        None
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _verify_key(public_key: str) -> VerifyKey:
+    """Decode a hex Ed25519 public key once; every handler for the same key shares it."""
+    return VerifyKey(bytes.fromhex(public_key))
+
+
+def verify_signature(signature: str, timestamp: str, body: bytes, public_key: str) -> bool:
+    """
+    Check a Discord Ed25519 request signature.
+    
+    Discord signs the timestamp header followed by the raw request body,
+    so the bytes are verified as received without decoding.
+    
+    Args:
+        signature: X-Signature-Ed25519 header (hex)
+        timestamp: X-Signature-Timestamp header
+        body: Raw request body
+        public_key: Application public key (hex)
+        
+    Returns:
+        True if the signature is valid, False otherwise
+    """
+    # Malformed headers can never verify; reject them before any Ed25519 work
+    if not (signature and _SIGNATURE_PATTERN.fullmatch(signature)):
+        return False
+    if not (timestamp and timestamp.isdigit()):
+        return False
+    
+    try:
+        _verify_key(public_key).verify(timestamp.encode() + body, bytes.fromhex(signature))
+        return True
+    except BadSignatureError:
+        return False
+
+
+def _modal_component_rows(post_type_value: str) -> List[Dict[str, Any]]:
+    """
+    Build the modal field rows for a post type.
+    
+    Literal construction is cheaper than copying a cached template, so
+    every call returns new rows the caller owns.
+    
+    Args:
+        post_type_value: Value of the PostType the modal is for
+        
+    Returns:
+        List of action rows, common fields first
+    """
+    # Common fields for all post types
+    components = [
+        {
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "title",
+                "label": "Title",
+                "style": 1,  # Short
+                "placeholder": "Enter post title...",
+                "required": True,
+                "max_length": 200
+            }]
+        },
+        {
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "content",
+                "label": "Content",
+                "style": 2,  # Paragraph
+                "placeholder": "Enter post content...",
+                "required": True,
+                "max_length": 4000
+            }]
+        },
+        {
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "tags",
+                "label": "Tags (comma-separated)",
+                "style": 1,  # Short
+                "placeholder": "tag1, tag2, tag3",
+                "required": False,
+                "max_length": 200
+            }]
+        },
+        {
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "slug",
+                "label": "Custom Slug (optional)",
+                "style": 1,  # Short
+                "placeholder": "Leave blank to auto-generate from title",
+                "required": False,
+                "max_length": 80
+            }]
+        }
+    ]
+    
+    # Type-specific fields
+    if post_type_value == PostType.RESPONSE.value:
+        components.append({
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "target_url",
+                "label": "Target URL",
+                "style": 1,  # Short
+                "placeholder": "https://example.com/original-post",
+                "required": True,
+                "max_length": 500
+            }]
+        })
+    
+    elif post_type_value == PostType.BOOKMARK.value:
+        components.append({
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "target_url",
+                "label": "Bookmark URL",
+                "style": 1,  # Short
+                "placeholder": "https://example.com/article",
+                "required": True,
+                "max_length": 500
+            }]
+        })
+    
+    elif post_type_value == PostType.MEDIA.value:
+        # Standard URL input; attachments replace this row per request
+        components.append({
+            "type": ComponentType.ACTION_ROW,
+            "components": [{
+                "type": ComponentType.TEXT_INPUT,
+                "custom_id": "media_url",
+                "label": "Media URL",
+                "style": 1,  # Short
+                "placeholder": "https://example.com/image.jpg",
+                "required": False,
+                "max_length": 500
+            }]
+        })
+    
+    return components
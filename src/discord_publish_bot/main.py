@@ -77,7 +77,7 @@ async def bot():
     async def handle_post(post_data: PostData) -> str:
         try:
             github_client = GitHubClient(
-                token=settings.github.token,
+                token=settings.github.token.get_secret_value(),
                 repository=settings.github.repository
             )
             
@@ -141,7 +141,7 @@ async def publish(
     
     # Create services
     github_client = GitHubClient(
-        token=settings.github.token,
+        token=settings.github.token.get_secret_value(),
         repository=settings.github.repository
     )
     
@@ -208,7 +208,7 @@ async def health():
         # Test connectivity
         try:
             github_client = GitHubClient(
-                token=settings.github.token,
+                token=settings.github.token.get_secret_value(),
                 repository=settings.github.repository
             )
             
@@ -7,6 +7,7 @@ Modernized publishing service with proper type safety and error handling.
 import logging
 import re
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Dict, Optional, List
 
 import yaml
@@ -40,13 +41,13 @@ class PublishingService:
     with proper validation and error handling.
     """
 
-    # Content type to source directory mapping
-    CONTENT_TYPE_DIRECTORIES = {
+    # Content type to source directory mapping (read-only, shared by all instances)
+    CONTENT_TYPE_DIRECTORIES = MappingProxyType({
         PostType.NOTE: "_src/notes",
         PostType.RESPONSE: "_src/responses", 
         PostType.BOOKMARK: "_src/bookmarks",
         PostType.MEDIA: "_src/media",
-    }
+    })
 
     # Frontmatter schema templates for target site compliance
     FRONTMATTER_SCHEMAS = {
@@ -138,7 +139,7 @@ class PublishingService:
             
             # Create branch for PR workflow
             now = datetime.now(timezone.utc)
-            branch_name = f"content/discord-bot/{now.strftime('%Y-%m-%d')}/{post_data.post_type.value}/{filename.replace('.md', '')}"
+            branch_name = f"content/discord-bot/{now.strftime('%Y-%m-%d')}/{post_data.post_type}/{filename.removesuffix('.md')}"
             
             try:
                 # Create feature branch
@@ -149,16 +150,16 @@ class PublishingService:
                 commit_info = await self.github_client.create_file(
                     path=filepath,
                     content=content,
-                    message=f"Add {post_data.post_type.value} post: {post_data.title}",
+                    message=f"Add {post_data.post_type} post: {post_data.title}",
                     branch=branch_name
                 )
                 
                 # Create pull request
-                pr_title = f"Add {post_data.post_type.value} post: {post_data.title}"
-                pr_body = f"""## New {post_data.post_type.value.title()} Post
+                pr_title = f"Add {post_data.post_type} post: {post_data.title}"
+                pr_body = f"""## New {post_data.post_type.title()} Post
 
 **Title:** {post_data.title}
-**Type:** {post_data.post_type.value}
+**Type:** {post_data.post_type}
 **File:** `{filepath}`
 
 ### Content Preview
@@ -166,7 +167,7 @@ class PublishingService:
 
 ### Frontmatter Validation
 - ✅ Title: {post_data.title}
-- ✅ Type: {post_data.post_type.value}
+- ✅ Type: {post_data.post_type}
 - ✅ Tags: {', '.join(post_data.tags) if post_data.tags else 'None'}
 
 **Created via Discord Publishing Bot**"""
@@ -183,7 +184,7 @@ class PublishingService:
                 
                 result = PublishResult(
                     success=True,
-                    message=f"{post_data.post_type.value.title()} post created successfully! PR #{pr.number}",
+                    message=f"{post_data.post_type.title()} post created successfully! PR #{pr.number}",
                     filename=filename,
                     filepath=filepath,
                     commit_sha=commit_info["sha"],
@@ -32,7 +32,9 @@ __all__ = [
     
     # Types
     "PostType",
+    "POST_TYPE_VALUES",
     "ResponseType",
+    "PublishStatus",
     "DeploymentMode",
     "Environment",
     "LogLevel",
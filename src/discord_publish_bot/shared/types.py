@@ -5,11 +5,11 @@ Defines common types used across multiple modules.
 """
 
 from typing import Any, Dict, Literal, Optional, Union
-from enum import Enum
+from enum import Enum, StrEnum
 from pydantic import BaseModel, Field
 
 
-class PostType(str, Enum):
+class PostType(StrEnum):
     """Supported post types."""
     NOTE = "note"
     RESPONSE = "response" 
@@ -17,6 +17,10 @@ class PostType(str, Enum):
     MEDIA = "media"
 
 
+# Raw post type values, for validating input without building the enum
+POST_TYPE_VALUES = frozenset(post_type.value for post_type in PostType)
+
+
 class ResponseType(str, Enum):
     """Supported response types for response posts."""
     REPLY = "reply"
@@ -24,6 +28,12 @@ class ResponseType(str, Enum):
     LIKE = "star"       # Discord shows "like", frontmatter uses "star"
 
 
+class PublishStatus(str, Enum):
+    """Outcome of a publishing operation."""
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
 class DeploymentMode(str, Enum):
     """Application deployment modes."""
     WEBSOCKET = "websocket"  # Traditional Discord bot with WebSocket
@@ -96,6 +106,11 @@ class PublishResult(BaseModel):
     # Error information
     error_code: Optional[str] = Field(None, description="Error code if publishing failed")
     error_details: Optional[Dict[str, Any]] = Field(None, description="Additional error information")
+    
+    @property
+    def status(self) -> PublishStatus:
+        """Publishing outcome as an enum, for callers that branch on it instead of the message."""
+        return PublishStatus.SUCCESS if self.success else PublishStatus.FAILED
 
 
 class DiscordInteraction(BaseModel):
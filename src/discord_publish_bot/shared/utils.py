@@ -4,10 +4,12 @@ Shared utilities for Discord Publish Bot.
 Common utility functions used across multiple modules.
 """
 
+import functools
 import hashlib
 import logging
 import re
 import unicodedata
+import warnings
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -15,6 +17,27 @@ from urllib.parse import urlparse
 
 from .types import PostType
 
+# Tag separators (comma or semicolon) plus the whitespace around them
+_TAG_SEPARATOR = re.compile(r'\s*[,;]\s*')
+
+# Script injections removed by sanitize_content
+_SCRIPT_BLOCK = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_JAVASCRIPT_SCHEME = re.compile(r'javascript:', re.IGNORECASE)
+
+# Characters dropped by slugify, and the separator runs it collapses to one hyphen
+_SLUG_NON_WORD = re.compile(r'[^\w\s-]')
+_SLUG_ASCII_PUNCTUATION = dict.fromkeys(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_-')
+)
+_SLUG_SEPARATOR_RUN = re.compile(r'[-\s]+')
+
+# Slugs that slugify would return unchanged (lowercase words joined by single hyphens)
+_CANONICAL_SLUG = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+
+# Extension appended to every generated filename
+_MARKDOWN_SUFFIX = '.md'
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -40,6 +63,7 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> loggin
     return logging.getLogger("discord_publish_bot")
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str, max_length: int = 100) -> str:
     """
     Convert text to URL-safe slug.
@@ -51,12 +75,16 @@ def slugify(text: str, max_length: int = 100) -> str:
     Returns:
         URL-safe slug
     """
-    # Normalize unicode characters
-    text = unicodedata.normalize('NFKD', text)
+    # Drop special chars; ASCII text is already normalized and only needs a
+    # single translate pass
+    if text.isascii():
+        text = text.translate(_SLUG_ASCII_PUNCTUATION)
+    else:
+        text = _SLUG_NON_WORD.sub('', unicodedata.normalize('NFKD', text))
     
-    # Convert to lowercase and replace spaces/special chars with hyphens
-    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
-    text = re.sub(r'[-\s]+', '-', text)
+    # Convert to lowercase and replace spaces with hyphens
+    text = text.strip().lower()
+    text = _SLUG_SEPARATOR_RUN.sub('-', text)
     
     # Truncate to max length and remove leading/trailing hyphens
     text = text[:max_length].strip('-')
@@ -77,14 +105,33 @@ def generate_filename(
         post_type: Type of post
         title: Post title
         slug: Optional custom slug (takes priority over auto-generated)
-        timestamp: Optional timestamp (not used, kept for compatibility)
+        timestamp: Deprecated and ignored; callers should stop passing it
         
     Returns:
         Generated filename with .md extension (no date prefix)
     """
-    if slug and slug.strip():
-        # Use custom slug if provided, sanitize it
-        filename_slug = slugify(slug.strip(), max_length=80)
+    if timestamp is not None:
+        warnings.warn(
+            "generate_filename() ignores timestamp; stop passing it",
+            DeprecationWarning,
+            stacklevel=2
+        )
+    
+    # The filename depends only on title and slug, so retries and repeated
+    # titles share one cache entry regardless of post type or timestamp
+    return _filename_for(title, slug)
+
+
+@functools.lru_cache(maxsize=256)
+def _filename_for(title: str, slug: Optional[str]) -> str:
+    """Build the filename for generate_filename from the title and custom slug."""
+    if slug and _CANONICAL_SLUG.fullmatch(slug):
+        # Custom slug is already what slugify would produce, bar the length limit
+        return slug[:80].rstrip('-') + _MARKDOWN_SUFFIX
+    
+    if slug and not slug.isspace():
+        # Use custom slug if provided, sanitize it (slugify strips whitespace)
+        filename_slug = slugify(slug, max_length=80)
         # If slug becomes empty after sanitization, fall back to title
         if not filename_slug:
             filename_slug = slugify(title, max_length=80)
@@ -92,7 +139,7 @@ def generate_filename(
         # Fall back to title-based generation
         filename_slug = slugify(title, max_length=80)
     
-    return f"{filename_slug}.md"
+    return filename_slug + _MARKDOWN_SUFFIX
 
 
 def validate_url(url: str) -> bool:
@@ -140,8 +187,8 @@ def sanitize_content(content: str) -> str:
         Sanitized content
     """
     # Remove potential script injections and clean up whitespace
-    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.IGNORECASE | re.DOTALL)
-    content = re.sub(r'javascript:', '', content, flags=re.IGNORECASE)
+    content = _SCRIPT_BLOCK.sub('', content)
+    content = _JAVASCRIPT_SCHEME.sub('', content)
     content = content.strip()
     
     return content
@@ -160,10 +207,8 @@ def parse_tags(tags_input: Optional[str]) -> List[str]:
     if not tags_input:
         return []
     
-    # Split by comma or semicolon
-    import re
-    tags = re.split(r'[,;]', tags_input)
-    tags = [tag.strip() for tag in tags if tag.strip()]
+    # Split by comma or semicolon, absorbing surrounding whitespace
+    tags = [tag for tag in _TAG_SEPARATOR.split(tags_input.strip()) if tag]
     
     # Remove duplicates while preserving order
     seen = set()
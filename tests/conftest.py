@@ -19,9 +19,12 @@ Provides safe, isolated test environment with mock credentials and dependencies.
 
 import os
 import asyncio
+import types
+import orjson
 import pytest
+from freezegun import freeze_time
 from pathlib import Path
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Mapping
 from unittest.mock import Mock, AsyncMock, patch
 
 # Security: List of environment variables that contain sensitive data
@@ -80,6 +83,14 @@ def isolate_test_environment():
     with patch.dict(os.environ, test_env, clear=False):
         yield
 
+@pytest.fixture
+def frozen_today():
+    """Pin the wall clock to midday 2025-08-09 (08:30 Eastern) for tests that assert generated dates."""
+    # Opt-in per test: freezegun also stops perf_counter, which would zero out timing asserts elsewhere.
+    # real_asyncio keeps the event loop on the real monotonic clock so sleeps and timeouts still advance
+    with freeze_time("2025-08-09 13:30:00", real_asyncio=True) as frozen:
+        yield frozen
+
 @pytest.fixture(autouse=True, scope="function")
 def prevent_dotenv_loading():
     """Prevent .env file loading during tests."""
@@ -89,7 +100,7 @@ def prevent_dotenv_loading():
 
 # Import our application modules AFTER security isolation setup
 from discord_publish_bot.config import AppSettings, DiscordSettings, GitHubSettings, APISettings, PublishingSettings
-from discord_publish_bot.publishing import GitHubClient, PublishingService
+from discord_publish_bot.publishing import PublishingService
 from discord_publish_bot.discord import DiscordInteractionsHandler
 from discord_publish_bot.shared import PostData, PostType
 
@@ -106,39 +117,74 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
-def test_env_vars(monkeypatch):
-    """Provide test environment variables."""
-    test_vars = {
-        "DISCORD_BOT_TOKEN": "FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_ONLY_123456789",
-        "DISCORD_APPLICATION_ID": "123456789012345678", 
-        "DISCORD_PUBLIC_KEY": "a" * 64,
-        "DISCORD_USER_ID": "987654321098765432",
-        "GITHUB_TOKEN": "ghp_test_token_1234567890abcdef",
-        "GITHUB_REPO": "test-user/test-repo",
-        "GITHUB_BRANCH": "main",
-        "API_KEY": "test_api_key_1234567890abcdef",
-        "API_HOST": "localhost",
-        "API_PORT": "8000",
-        "SITE_BASE_URL": "https://test-site.example.com",
-        "DEFAULT_AUTHOR": "Test Author",
-        "ENVIRONMENT": "development",
-        "LOG_LEVEL": "DEBUG"
-    }
+@pytest.fixture(scope="session")
+async def http_session():
+    """Provide one aiohttp session shared by the network tests, keeping localhost connections warm."""
+    import aiohttp
     
-    for key, value in test_vars.items():
-        monkeypatch.setenv(key, value)
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+_TEST_ENV_VARS = types.MappingProxyType({
+    "DISCORD_BOT_TOKEN": "FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_ONLY_123456789",
+    "DISCORD_APPLICATION_ID": "123456789012345678", 
+    "DISCORD_PUBLIC_KEY": "a" * 64,
+    "DISCORD_USER_ID": "987654321098765432",
+    "GITHUB_TOKEN": "ghp_test_token_1234567890abcdef",
+    "GITHUB_REPO": "test-user/test-repo",
+    "GITHUB_BRANCH": "main",
+    "API_KEY": "test_api_key_1234567890abcdef",
+    "API_HOST": "localhost",
+    "API_PORT": "8000",
+    "SITE_BASE_URL": "https://test-site.example.com",
+    "DEFAULT_AUTHOR": "Test Author",
+    "ENVIRONMENT": "development",
+    "LOG_LEVEL": "DEBUG"
+})
+
+
+@pytest.fixture(scope="session")
+def test_env_vars() -> Mapping[str, str]:
+    """
+    Provide test environment variables as a read-only mapping.
     
-    return test_vars
+    Nothing is exported; apply them with patch.dict(os.environ, test_env_vars).
+    """
+    return _TEST_ENV_VARS
+
+
+# Environment variables AppSettings.from_env() reads, by prefix and by exact name
+_SETTINGS_ENV_PREFIXES = ("DISCORD_", "GITHUB_", "API_", "AZURE_STORAGE_", "LINODE_STORAGE_", "ENABLE_")
+_SETTINGS_ENV_NAMES = frozenset({
+    "DEFAULT_AUTHOR", "ENVIRONMENT", "FASTAPI_ENDPOINT", "LOG_LEVEL", "SITE_BASE_URL", "STORAGE_PROVIDER"
+})
 
 
 @pytest.fixture
+def settings_env(test_env_vars, monkeypatch) -> Mapping[str, str]:
+    """
+    Apply test_env_vars after removing any other settings variables.
+    
+    Only the keys AppSettings reads are touched, so the rest of os.environ is
+    not copied and restored the way patch.dict(..., clear=True) would.
+    """
+    for key in [k for k in os.environ if k.startswith(_SETTINGS_ENV_PREFIXES) or k in _SETTINGS_ENV_NAMES]:
+        monkeypatch.delenv(key)
+    for key, value in test_env_vars.items():
+        monkeypatch.setenv(key, value)
+    return test_env_vars
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> AppSettings:
     """
     Provide test application settings with completely safe, fake defaults.
     
     These credentials are designed to be obviously fake and safe for testing.
-    They will never work with real services.
+    They will never work with real services. The settings are built once per
+    session and must be treated as read-only.
     """
     # Double-check security before creating settings
     verify_no_production_credentials()
@@ -172,27 +218,118 @@ def test_settings() -> AppSettings:
     )
 
 
+@pytest.fixture(scope="session")
+def test_settings_dump(test_settings):
+    """Serialize the session settings once; exposes ``data`` (model_dump) and ``json`` (model_dump_json)."""
+    return types.SimpleNamespace(
+        data=test_settings.model_dump(),
+        json=test_settings.model_dump_json()
+    )
+
+
+class FakeGitHubClient:
+    """Deterministic in-memory stand-in for GitHubClient that records calls as plain dicts."""
+    
+    COMMIT_SHA = "abc123def456"
+    COMMIT_URL = "https://github.com/test/repo/commit/abc123def456"
+    
+    def __init__(self):
+        # Set to an exception to make create_file fail after recording the call
+        self.fail_with = None
+        self.create_branch_calls = []
+        self.delete_branch_calls = []
+        self.create_file_calls = []
+        self.create_commit_calls = []
+        self.create_pull_request_calls = []
+    
+    async def check_connectivity(self) -> bool:
+        return True
+    
+    async def create_branch(self, branch_name: str, source_branch: str = "main"):
+        self.create_branch_calls.append({"branch_name": branch_name, "source_branch": source_branch})
+        return types.SimpleNamespace(ref=f"refs/heads/{branch_name}")
+    
+    async def create_file(self, **kwargs) -> Dict[str, Any]:
+        self.create_file_calls.append(kwargs)
+        if self.fail_with is not None:
+            raise self.fail_with
+        return {"sha": self.COMMIT_SHA, "url": self.COMMIT_URL}
+    
+    async def create_commit(self, **kwargs) -> Dict[str, Any]:
+        self.create_commit_calls.append(kwargs)
+        return {"sha": self.COMMIT_SHA, "url": self.COMMIT_URL}
+    
+    async def create_pull_request(self, **kwargs):
+        self.create_pull_request_calls.append(kwargs)
+        number = len(self.create_pull_request_calls)
+        return types.SimpleNamespace(number=number, html_url=f"https://github.com/test/repo/pull/{number}")
+    
+    async def delete_branch(self, branch_name: str) -> bool:
+        self.delete_branch_calls.append(branch_name)
+        return True
+
+
 @pytest.fixture
-def mock_github_client():
-    """Provide a mock GitHub client for testing."""
-    client = Mock(spec=GitHubClient)
-    client.check_connectivity = AsyncMock(return_value=True)
+def fake_github_client() -> FakeGitHubClient:
+    """Provide a fresh fake GitHub client."""
+    return FakeGitHubClient()
+
+
+# Read-only canned responses shared by every mock GitHub client
+_COMMIT_RESULT = types.MappingProxyType({
+    "sha": FakeGitHubClient.COMMIT_SHA,
+    "url": FakeGitHubClient.COMMIT_URL
+})
+_REPOSITORY_INFO = types.MappingProxyType({
+    "name": "test-repo",
+    "owner": types.MappingProxyType({"login": "test-user"}),
+    "default_branch": "main"
+})
+_BRANCH_REF = types.SimpleNamespace(ref="refs/heads/test-branch")
+_PULL_REQUEST = types.SimpleNamespace(number=1, html_url="https://github.com/test/repo/pull/1")
+
+
+# Canned return value of each mock GitHub client method, re-seeded after every test
+_GITHUB_CLIENT_RETURNS = types.MappingProxyType({
+    "check_connectivity": True,
+    "create_branch": _BRANCH_REF,
+    "create_file": _COMMIT_RESULT,
     # Fix: create_commit should return direct sha/url structure, not nested
-    client.create_commit = AsyncMock(return_value={
-        "sha": "abc123def456",
-        "url": "https://github.com/test/repo/commit/abc123def456"
-    })
-    client.get_repository_info = Mock(return_value={
-        "name": "test-repo",
-        "owner": {"login": "test-user"},
-        "default_branch": "main"
+    "create_commit": _COMMIT_RESULT,
+    "create_pull_request": _PULL_REQUEST,
+    "delete_branch": True,
+    "get_repository_info": _REPOSITORY_INFO,
+})
+
+
+@pytest.fixture(scope="module")
+def _module_github_client():
+    """Build the mock GitHub client once per module; use mock_github_client in tests."""
+    # Plain namespace exposing only the methods the service uses, awaited ones
+    # as AsyncMock; Mock(spec=GitHubClient) introspected the whole class and left them sync.
+    return types.SimpleNamespace(**{
+        name: (Mock if name == "get_repository_info" else AsyncMock)(return_value=value)
+        for name, value in _GITHUB_CLIENT_RETURNS.items()
     })
-    return client
 
 
 @pytest.fixture
+def mock_github_client(_module_github_client):
+    """Provide a mock GitHub client for testing (shared per module, reset after each use)."""
+    methods = dict(vars(_module_github_client))
+    yield _module_github_client
+    # Put back any method a test replaced, then drop recorded calls, side effects
+    # and return values so the next test starts from the canned responses
+    vars(_module_github_client).clear()
+    vars(_module_github_client).update(methods)
+    for name, method in methods.items():
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = _GITHUB_CLIENT_RETURNS[name]
+
+
+@pytest.fixture(scope="session")
 def sample_post_data() -> Dict[str, PostData]:
-    """Provide sample post data for testing."""
+    """Provide sample post data for testing (shared across the session, do not mutate)."""
     return {
         "note": PostData(
             title="Test Note",
@@ -224,77 +361,139 @@ def sample_post_data() -> Dict[str, PostData]:
     }
 
 
-@pytest.fixture
-def discord_interaction_payloads() -> Dict[str, Dict[str, Any]]:
-    """Provide sample Discord interaction payloads."""
-    return {
-        "ping": {
-            "type": 1,
-            "id": "test_ping_interaction",
-            "application_id": "123456789012345678",
-            "token": "test_token",
-            "version": 1
+@pytest.fixture(scope="session")
+def long_content() -> str:
+    """Provide a very long post body (~27,000 characters), built once per session."""
+    return "This is a very long post. " * 1000
+
+
+@pytest.fixture(scope="session")
+def short_post() -> PostData:
+    """Provide a minimal note post (shared across the session, do not mutate)."""
+    return PostData(title="Short", content="Hi", post_type=PostType.NOTE, tags=["test"])
+
+
+@pytest.fixture(scope="session")
+def long_post(long_content) -> PostData:
+    """Provide a note post with a very long body (shared across the session, do not mutate)."""
+    return PostData(title="Long Post", content=long_content, post_type=PostType.NOTE, tags=["test"])
+
+
+# Sample Discord interaction payloads, shared read-only; copy via fresh_payload before mutating
+_INTERACTION_PAYLOADS = types.MappingProxyType({
+    "ping": {
+        "type": 1,
+        "id": "test_ping_interaction",
+        "application_id": "123456789012345678",
+        "token": "test_token",
+        "version": 1
+    },
+    "slash_command": {
+        "type": 2,
+        "id": "test_command_interaction",
+        "application_id": "123456789012345678",
+        "token": "test_token",
+        "version": 1,
+        "user": {
+            "id": "987654321098765432",
+            "username": "testuser"
         },
-        "slash_command": {
-            "type": 2,
-            "id": "test_command_interaction",
-            "application_id": "123456789012345678",
-            "token": "test_token",
-            "version": 1,
-            "user": {
-                "id": "987654321098765432",
-                "username": "testuser"
-            },
-            "data": {
-                "id": "test_command_id",
-                "name": "post",
-                "type": 1,
-                "options": [
-                    {
-                        "name": "type",
-                        "type": 3,
-                        "value": "note"
-                    }
-                ]
-            }
+        "data": {
+            "id": "test_command_id",
+            "name": "post",
+            "type": 1,
+            "options": [
+                {
+                    "name": "type",
+                    "type": 3,
+                    "value": "note"
+                }
+            ]
+        }
+    },
+    "modal_submit": {
+        "type": 5,
+        "id": "test_modal_interaction",
+        "application_id": "123456789012345678",
+        "token": "test_token",
+        "version": 1,
+        "user": {
+            "id": "987654321098765432",
+            "username": "testuser"
         },
-        "modal_submit": {
-            "type": 5,
-            "id": "test_modal_interaction",
-            "application_id": "123456789012345678",
-            "token": "test_token",
-            "version": 1,
-            "user": {
-                "id": "987654321098765432",
-                "username": "testuser"
-            },
-            "data": {
-                "custom_id": "post_modal_note",
-                "components": [
-                    {
-                        "type": 1,
-                        "components": [
-                            {
-                                "type": 4,
-                                "custom_id": "title",
-                                "value": "Test Modal Post"
-                            }
-                        ]
-                    },
-                    {
-                        "type": 1,
-                        "components": [
-                            {
-                                "type": 4,
-                                "custom_id": "content",
-                                "value": "Content from modal submission"
-                            }
-                        ]
-                    }
-                ]
-            }
+        "data": {
+            "custom_id": "post_modal_note",
+            "components": [
+                {
+                    "type": 1,
+                    "components": [
+                        {
+                            "type": 4,
+                            "custom_id": "title",
+                            "value": "Test Modal Post"
+                        }
+                    ]
+                },
+                {
+                    "type": 1,
+                    "components": [
+                        {
+                            "type": 4,
+                            "custom_id": "content",
+                            "value": "Content from modal submission"
+                        }
+                    ]
+                }
+            ]
         }
     }
+})
+
+
+def _clone(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Deep-copy a JSON-shaped payload with a C-level orjson round trip."""
+    return orjson.loads(orjson.dumps(payload))
+
+
+@pytest.fixture(scope="session")
+def discord_interaction_payloads() -> Mapping[str, Dict[str, Any]]:
+    """Provide sample Discord interaction payloads (shared across the session, do not mutate)."""
+    return _INTERACTION_PAYLOADS
+
+
+@pytest.fixture
+def fresh_payload(discord_interaction_payloads):
+    """Provide a helper returning a private deep copy of a sample payload by name."""
+    return lambda name: _clone(discord_interaction_payloads[name])
+
+
+@pytest.fixture
+def make_modal_payload(discord_interaction_payloads):
+    """Provide a builder for modal submit payloads with one text input row per field."""
+    base = discord_interaction_payloads["modal_submit"]
+    
+    def build(custom_id: str, **fields: str) -> Dict[str, Any]:
+        payload = _clone(base)
+        payload["data"]["custom_id"] = custom_id
+        payload["data"]["components"] = [
+            {"type": 1, "components": [{"type": 4, "custom_id": name, "value": value}]}
+            for name, value in fields.items()
+        ]
+        return payload
+    
+    return build
+
+
+@pytest.fixture
+def discord_followups(monkeypatch) -> list:
+    """Record the follow-up messages process_post_creation would send to Discord."""
+    messages = []
+    
+    async def record(interaction: Dict[str, Any], message: str) -> None:
+        messages.append(message)
+    
+    monkeypatch.setattr("discord_publish_bot.api.routes.discord.send_discord_followup", record)
+    return messages
 
 
 @pytest.fixture
@@ -307,26 +506,36 @@ def publishing_service(test_settings, mock_github_client):
     )
 
 
-@pytest.fixture
-def mock_discord_bot(test_settings):
-    """Provide a mock Discord bot for testing."""
-    return DiscordInteractionsHandler(test_settings.discord)
+@pytest.fixture(scope="session")
+def session_publishing_service(test_settings):
+    """Provide a publishing service shared across the session for tests that never publish."""
+    return PublishingService(
+        github_client=FakeGitHubClient(),
+        github_settings=test_settings.github,
+        publishing_settings=test_settings.publishing
+    )
 
 
-# Test markers
-def pytest_configure(config):
-    """Configure custom pytest markers."""
-    config.addinivalue_line(
-        "markers", "unit: marks tests as unit tests (fast, isolated)"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (moderate speed, external deps)"
-    )
-    config.addinivalue_line(
-        "markers", "e2e: marks tests as end-to-end tests (slow, full system)"
-    )
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow running"
+@pytest.fixture(scope="session")
+def session_discord_handler(test_settings):
+    """Provide a Discord handler shared across the session; copy.copy it before mutating."""
+    return DiscordInteractionsHandler(test_settings)
+
+
+@pytest.fixture(scope="session")
+def mock_discord_bot(session_discord_handler):
+    """Provide the session-wide Discord handler for testing."""
+    return session_discord_handler
+
+
+# Command line options
+def pytest_addoption(parser):
+    """Add command line option for network tests."""
+    parser.addoption(
+        "--run-network-tests",
+        action="store_true",
+        default=False,
+        help="Run tests that require network connectivity"
     )
 
 
@@ -354,6 +563,24 @@ class TestHelper:
         
         for field in required_fields.get(post_type, []):
             assert field in frontmatter, f"Missing required field '{field}' for {post_type}"
+    
+    @staticmethod
+    async def wait_for_http_ready(session, url: str, timeout: float = 5.0, interval: float = 0.05) -> None:
+        """Poll a URL with the given aiohttp session until it answers 200, failing the test once the timeout elapses."""
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=0.2)) as response:
+                    if response.status == 200:
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(interval)
+        
+        pytest.fail(f"Server at {url} not ready after {timeout}s")
 
 
 @pytest.fixture
@@ -4,12 +4,49 @@ Integration tests for Discord integration functionality.
 Tests Discord interactions with mocked Discord API but real application logic.
 """
 
+import asyncio
+import copy
 import pytest
 import json
-from unittest.mock import AsyncMock, Mock, patch
+from collections import namedtuple
+from unittest.mock import patch
 
-from discord_publish_bot.discord.interactions import DiscordInteractionsHandler
-from discord_publish_bot.shared import PostData, PostType
+from discord_publish_bot.api.routes.discord import process_post_creation
+from discord_publish_bot.discord.interactions import DiscordInteractionsHandler, InteractionResponseType
+from discord_publish_bot.shared import DiscordCommandError, PostData, PostType
+
+
+# Interactions of a type the handler does not know get an ephemeral notice
+UNKNOWN_TYPE_PAYLOADS = (
+    pytest.param({}, id="empty"),
+    pytest.param({"type": 999}, id="invalid-type"),
+)
+
+# Malformed commands and modals are surfaced as DiscordCommandError (payload, message match)
+MALFORMED_PAYLOADS = (
+    pytest.param({"type": 2, "data": {}}, "Failed to handle command", id="missing-command-data"),
+    pytest.param(
+        {"type": 5, "user": {"id": "987654321098765432"}, "data": {"custom_id": "unknown_modal"}},
+        "Invalid modal custom_id",
+        id="unknown-modal",
+    ),
+)
+
+StubPublishResult = namedtuple(
+    "StubPublishResult", "success message site_url error_code filename", defaults=(None, None, None)
+)
+
+
+class _StubPublishingService:
+    """Publishing service stand-in whose publish_post returns a fixed result."""
+    
+    def __init__(self, result: StubPublishResult):
+        self.result = result
+        self.published = []
+    
+    async def publish_post(self, post_data):
+        self.published.append(post_data)
+        return self.result
 
 
 @pytest.mark.integration
@@ -17,17 +54,17 @@ class TestDiscordIntegration:
     """Test Discord integration with application components."""
     
     @pytest.fixture
-    def discord_bot(self, test_settings, mock_github_client):
-        """Create Discord bot with mocked dependencies."""
-        with patch('discord_publish_bot.api.dependencies.get_github_client', return_value=mock_github_client):
-            return DiscordInteractionsHandler(test_settings.discord)
+    def discord_bot(self, session_discord_handler):
+        """Provide a shallow copy of the session handler; tests swap its publishing service."""
+        return copy.copy(session_discord_handler)
     
-    @pytest.mark.asyncio
-    async def test_full_interaction_flow_note(self, discord_bot, discord_interaction_payloads):
+    async def test_full_interaction_flow_note(
+        self, discord_bot, fresh_payload, make_modal_payload, discord_followups
+    ):
         """Test complete interaction flow for creating a note."""
         # Step 1: Slash command interaction
-        command_payload = discord_interaction_payloads["slash_command"]
-        command_payload["data"]["options"] = [{"name": "type", "value": "note"}]
+        command_payload = fresh_payload("slash_command")
+        command_payload["data"]["options"] = [{"name": "post_type", "value": "note"}]
         
         response = await discord_bot.handle_interaction(command_payload)
         
@@ -35,54 +72,37 @@ class TestDiscordIntegration:
         assert "note" in response["data"]["custom_id"]
         
         # Step 2: Modal submission
-        modal_payload = discord_interaction_payloads["modal_submit"]
-        modal_payload["data"]["custom_id"] = "post_modal_note"
-        modal_payload["data"]["components"] = [
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "title",
-                    "value": "Integration Test Note"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "content",
-                    "value": "This is a note created through integration testing."
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "tags",
-                    "value": "integration, testing"
-                }]
-            }
-        ]
-        
-        with patch.object(discord_bot, 'publishing_service') as mock_service:
-            mock_service.publish_post.return_value = Mock(
-                success=True,
-                message="Post published successfully",
-                site_url="https://test.example.com/posts/integration-test-note"
-            )
-            
-            response = await discord_bot.handle_interaction(modal_payload)
-            
-            assert response["type"] == 4  # CHANNEL_MESSAGE_WITH_SOURCE
-            assert "successfully" in response["data"]["content"]
-            assert "https://test.example.com" in response["data"]["content"]
+        modal_payload = make_modal_payload(
+            "post_modal_note",
+            title="Integration Test Note",
+            content="This is a note created through integration testing.",
+            tags="integration, testing"
+        )
+        
+        discord_bot.publishing_service = _StubPublishingService(StubPublishResult(
+            success=True,
+            message="Post published successfully",
+            site_url="https://test.example.com/posts/integration-test-note"
+        ))
+        
+        response = await discord_bot.handle_interaction(modal_payload)
+        
+        assert response["type"] == InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        
+        # Step 3: Background publishing reports back through a follow-up
+        await process_post_creation(modal_payload, discord_bot, discord_bot.publishing_service)
+        
+        assert len(discord_bot.publishing_service.published) == 1
+        assert "successfully" in discord_followups[-1]
+        assert "https://test.example.com" in discord_followups[-1]
     
-    @pytest.mark.asyncio
-    async def test_full_interaction_flow_response(self, discord_bot, discord_interaction_payloads):
+    async def test_full_interaction_flow_response(
+        self, discord_bot, fresh_payload, make_modal_payload, discord_followups
+    ):
         """Test complete interaction flow for creating a response post."""
         # Slash command for response
-        command_payload = discord_interaction_payloads["slash_command"]
-        command_payload["data"]["options"] = [{"name": "type", "value": "response"}]
+        command_payload = fresh_payload("slash_command")
+        command_payload["data"]["options"] = [{"name": "post_type", "value": "response"}]
         
         response = await discord_bot.handle_interaction(command_payload)
         
@@ -90,106 +110,66 @@ class TestDiscordIntegration:
         assert "response" in response["data"]["custom_id"]
         
         # Modal submission with target URL
-        modal_payload = discord_interaction_payloads["modal_submit"]
-        modal_payload["data"]["custom_id"] = "post_modal_response"
-        modal_payload["data"]["components"] = [
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "title",
-                    "value": "Re: Great Article"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "content",
-                    "value": "Thanks for sharing this insight!"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "target_url",
-                    "value": "https://example.com/great-article"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "tags",
-                    "value": "response, discussion"
-                }]
-            }
-        ]
-        
-        with patch.object(discord_bot, 'publishing_service') as mock_service:
-            mock_service.publish_post.return_value = Mock(
-                success=True,
-                message="Response post published successfully",
-                site_url="https://test.example.com/posts/re-great-article"
-            )
-            
-            response = await discord_bot.handle_interaction(modal_payload)
-            
-            assert response["type"] == 4
-            assert "successfully" in response["data"]["content"]
+        modal_payload = make_modal_payload(
+            "post_modal_response",
+            title="Re: Great Article",
+            content="Thanks for sharing this insight!",
+            target_url="https://example.com/great-article",
+            tags="response, discussion"
+        )
+        
+        discord_bot.publishing_service = _StubPublishingService(StubPublishResult(
+            success=True,
+            message="Response post published successfully",
+            site_url="https://test.example.com/posts/re-great-article"
+        ))
+        
+        response = await discord_bot.handle_interaction(modal_payload)
+        
+        assert response["type"] == InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        
+        await process_post_creation(modal_payload, discord_bot, discord_bot.publishing_service)
+        
+        (post_data,) = discord_bot.publishing_service.published
+        assert post_data.target_url == "https://example.com/great-article"
+        assert "successfully" in discord_followups[-1]
     
-    @pytest.mark.asyncio
-    async def test_error_handling_publishing_failure(self, discord_bot, discord_interaction_payloads):
+    async def test_error_handling_publishing_failure(self, discord_bot, make_modal_payload, discord_followups):
         """Test error handling when publishing fails."""
-        modal_payload = discord_interaction_payloads["modal_submit"]
-        modal_payload["data"]["custom_id"] = "post_modal_note"
-        modal_payload["data"]["components"] = [
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "title",
-                    "value": "Failed Post"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "content",
-                    "value": "This post will fail to publish"
-                }]
-            }
-        ]
-        
-        with patch.object(discord_bot, 'publishing_service') as mock_service:
-            mock_service.publish_post.return_value = Mock(
-                success=False,
-                message="GitHub API error: Repository not found"
-            )
-            
-            response = await discord_bot.handle_interaction(modal_payload)
-            
-            assert response["type"] == 4
-            assert "error" in response["data"]["content"].lower()
-            assert "repository not found" in response["data"]["content"]
+        modal_payload = make_modal_payload(
+            "post_modal_note",
+            title="Failed Post",
+            content="This post will fail to publish"
+        )
+        
+        discord_bot.publishing_service = _StubPublishingService(StubPublishResult(
+            success=False,
+            message="GitHub API error: Repository not found"
+        ))
+        
+        response = await discord_bot.handle_interaction(modal_payload)
+        
+        assert response["type"] == InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        
+        await process_post_creation(modal_payload, discord_bot, discord_bot.publishing_service)
+        
+        assert "error" in discord_followups[-1].lower()
+        assert "Repository not found" in discord_followups[-1]
     
-    @pytest.mark.asyncio
-    async def test_invalid_interaction_handling(self, discord_bot):
-        """Test handling of invalid or malformed interactions."""
-        invalid_payloads = [
-            {},  # Empty payload
-            {"type": 999},  # Invalid type
-            {"type": 2, "data": {}},  # Missing required data
-            {"type": 5, "data": {"custom_id": "unknown_modal"}},  # Unknown modal
-        ]
-        
-        for payload in invalid_payloads:
-            response = await discord_bot.handle_interaction(payload)
-            
-            assert response["type"] == 4  # Error message response
-            assert "error" in response["data"]["content"].lower()
+    @pytest.mark.parametrize("payload", UNKNOWN_TYPE_PAYLOADS)
+    async def test_unknown_interaction_type(self, discord_bot, payload):
+        """Test interactions of an unknown type get an ephemeral notice."""
+        response = await discord_bot.handle_interaction(payload)
+        
+        assert response["type"] == InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE
+        assert response["data"]["content"] == "Unknown interaction type"
+        assert response["data"]["flags"] == 64  # Ephemeral
+    
+    @pytest.mark.parametrize("payload,message", MALFORMED_PAYLOADS)
+    async def test_malformed_interaction_handling(self, discord_bot, payload, message):
+        """Test malformed commands and modal submissions raise DiscordCommandError."""
+        with pytest.raises(DiscordCommandError, match=message):
+            await discord_bot.handle_interaction(payload)
     
     def test_signature_verification_integration(self, discord_bot):
         """Test Discord signature verification with realistic data."""
@@ -209,54 +189,28 @@ class TestDiscordIntegration:
                 signature, timestamp, body, discord_bot.settings.discord.public_key
             )
     
-    @pytest.mark.asyncio
-    async def test_rate_limiting_simulation(self, discord_bot, discord_interaction_payloads):
-        """Test behavior under rapid interaction submissions."""
-        command_payload = discord_interaction_payloads["slash_command"]
-        
-        # Simulate multiple rapid requests
-        responses = []
-        for i in range(5):
-            response = await discord_bot.handle_interaction(command_payload)
-            responses.append(response)
+    async def test_rate_limiting_simulation(self, discord_bot, fresh_payload):
+        """Test behavior under rapid concurrent interaction submissions."""
+        # Simulate multiple concurrent requests, each with its own payload copy
+        responses = await asyncio.gather(*(
+            discord_bot.handle_interaction(fresh_payload("slash_command"))
+            for _ in range(5)
+        ))
         
         # All should be handled properly (no rate limiting in our implementation)
         for response in responses:
             assert response["type"] == 9  # MODAL response
     
-    def test_modal_component_extraction(self, discord_bot):
+    def test_modal_component_extraction(self, discord_bot, make_modal_payload):
         """Test extraction of data from Discord modal components."""
-        modal_data = {
-            "custom_id": "post_modal_note",
-            "components": [
-                {
-                    "type": 1,
-                    "components": [{
-                        "type": 4,
-                        "custom_id": "title",
-                        "value": "Test Title"
-                    }]
-                },
-                {
-                    "type": 1,
-                    "components": [{
-                        "type": 4,
-                        "custom_id": "content",
-                        "value": "Test content here"
-                    }]
-                },
-                {
-                    "type": 1,
-                    "components": [{
-                        "type": 4,
-                        "custom_id": "tags",
-                        "value": "test, integration"
-                    }]
-                }
-            ]
-        }
+        payload = make_modal_payload(
+            "post_modal_note",
+            title="Test Title",
+            content="Test content here",
+            tags="test, integration",
+        )
         
-        post_data = discord_bot._extract_post_data_from_modal(modal_data)
+        post_data = discord_bot.extract_post_data_from_modal(payload)
         
         assert isinstance(post_data, PostData)
         assert post_data.title == "Test Title"
@@ -264,161 +218,115 @@ class TestDiscordIntegration:
         assert post_data.tags == ["test", "integration"]
         assert post_data.post_type == PostType.NOTE
     
-    def test_different_post_type_modals(self, discord_bot):
-        """Test modal creation for different post types."""
-        post_types = ["note", "response", "bookmark", "media"]
+    @pytest.mark.parametrize("post_type", [PostType.NOTE, PostType.RESPONSE, PostType.BOOKMARK, PostType.MEDIA])
+    def test_different_post_type_modals(self, session_discord_handler, post_type):
+        """Test modal creation for each post type."""
+        modal = session_discord_handler._create_post_modal(post_type)
         
-        for post_type in post_types:
-            modal = discord_bot._create_post_modal(post_type)
-            
-            assert modal["type"] == 9  # MODAL type
-            assert post_type in modal["data"]["custom_id"]
-            
-            components = modal["data"]["components"]
-            
-            # All modals should have title and content
-            component_ids = []
-            for action_row in components:
-                for component in action_row["components"]:
-                    component_ids.append(component["custom_id"])
-            
-            assert "title" in component_ids
-            assert "content" in component_ids
-            
-            # Response and bookmark should have target_url
-            if post_type in ["response", "bookmark"]:
-                assert "target_url" in component_ids
-            
-            # Media should have media_url
-            if post_type == "media":
-                assert "media_url" in component_ids
+        assert post_type.value in modal["custom_id"]
+        
+        # All modals should have title and content
+        component_ids = {
+            component["custom_id"]
+            for action_row in modal["components"]
+            for component in action_row["components"]
+        }
+        
+        assert "title" in component_ids
+        assert "content" in component_ids
+        
+        # Response and bookmark should have target_url
+        if post_type in (PostType.RESPONSE, PostType.BOOKMARK):
+            assert "target_url" in component_ids
+        
+        # Media should have media_url
+        if post_type == PostType.MEDIA:
+            assert "media_url" in component_ids
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 class TestDiscordPublishingIntegration:
     """Test integration between Discord and publishing service."""
     
     @pytest.fixture
-    def discord_bot_with_real_publishing(self, test_settings, mock_github_client):
-        """Create Discord bot with real publishing service but mocked GitHub."""
+    def discord_bot_with_real_publishing(self, session_discord_handler, test_settings, fake_github_client):
+        """Create Discord bot with real publishing service but fake GitHub."""
         from discord_publish_bot.publishing.service import PublishingService
         
         publishing_service = PublishingService(
-            github_client=mock_github_client,
+            github_client=fake_github_client,
             github_settings=test_settings.github,
             publishing_settings=test_settings.publishing
         )
         
-        bot = DiscordInteractionsHandler(test_settings.discord)
+        bot = copy.copy(session_discord_handler)
         bot.publishing_service = publishing_service
         
         return bot
     
-    @pytest.mark.asyncio
-    async def test_end_to_end_note_publishing(self, discord_bot_with_real_publishing, discord_interaction_payloads):
+    async def test_end_to_end_note_publishing(
+        self, discord_bot_with_real_publishing, make_modal_payload, discord_followups
+    ):
         """Test end-to-end note publishing through Discord."""
-        modal_payload = discord_interaction_payloads["modal_submit"]
-        modal_payload["data"]["custom_id"] = "post_modal_note"
-        modal_payload["data"]["components"] = [
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "title",
-                    "value": "E2E Integration Test"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "content",
-                    "value": "This tests the complete flow from Discord to GitHub."
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "tags",
-                    "value": "integration, e2e, testing"
-                }]
-            }
-        ]
-        
-        response = await discord_bot_with_real_publishing.handle_interaction(modal_payload)
-        
-        assert response["type"] == 4
-        assert "successfully" in response["data"]["content"]
+        modal_payload = make_modal_payload(
+            "post_modal_note",
+            title="E2E Integration Test",
+            content="This tests the complete flow from Discord to GitHub.",
+            tags="integration, e2e, testing"
+        )
+        
+        bot = discord_bot_with_real_publishing
+        response = await bot.handle_interaction(modal_payload)
+        
+        assert response["type"] == InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        
+        await process_post_creation(modal_payload, bot, bot.publishing_service)
+        
+        assert "successfully" in discord_followups[-1]
         
         # Verify GitHub client was called
         github_client = discord_bot_with_real_publishing.publishing_service.github_client
-        github_client.create_file.assert_called_once()
+        assert len(github_client.create_file_calls) == 1
         
         # Verify the content passed to GitHub
-        call_args = github_client.create_file.call_args
-        filename, content, commit_message = call_args[0]
+        call = github_client.create_file_calls[0]
+        filename, content, commit_message = call["path"], call["content"], call["message"]
         
         assert filename.endswith(".md")
         assert "E2E Integration Test" in content
         assert "This tests the complete flow" in content
         assert "integration" in content
-        assert "commit" in commit_message.lower()
+        assert commit_message == "Add note post: E2E Integration Test"
     
-    @pytest.mark.asyncio
-    async def test_frontmatter_generation_through_discord(self, discord_bot_with_real_publishing, discord_interaction_payloads):
+    async def test_frontmatter_generation_through_discord(
+        self, discord_bot_with_real_publishing, make_modal_payload, discord_followups
+    ):
         """Test that frontmatter is correctly generated through Discord workflow."""
         # Test response post with target URL
-        modal_payload = discord_interaction_payloads["modal_submit"]
-        modal_payload["data"]["custom_id"] = "post_modal_response"
-        modal_payload["data"]["components"] = [
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "title",
-                    "value": "Response to Article"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "content",
-                    "value": "Great points made in this article!"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "target_url",
-                    "value": "https://example.com/original-article"
-                }]
-            },
-            {
-                "type": 1,
-                "components": [{
-                    "type": 4,
-                    "custom_id": "tags",
-                    "value": "response, discussion"
-                }]
-            }
-        ]
-        
-        response = await discord_bot_with_real_publishing.handle_interaction(modal_payload)
-        
-        assert response["type"] == 4
-        assert "successfully" in response["data"]["content"]
+        modal_payload = make_modal_payload(
+            "post_modal_response",
+            title="Response to Article",
+            content="Great points made in this article!",
+            target_url="https://example.com/original-article",
+            tags="response, discussion"
+        )
+        
+        bot = discord_bot_with_real_publishing
+        response = await bot.handle_interaction(modal_payload)
+        
+        assert response["type"] == InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+        
+        await process_post_creation(modal_payload, bot, bot.publishing_service)
+        
+        assert "successfully" in discord_followups[-1]
         
         # Verify the frontmatter in the generated content
         github_client = discord_bot_with_real_publishing.publishing_service.github_client
-        call_args = github_client.create_file.call_args
-        content = call_args[0][1]  # Content is second argument
+        content = github_client.create_file_calls[0]["content"]
         
-        # Should contain response post frontmatter
-        assert "response_type: response" in content
-        assert "in_reply_to: https://example.com/original-article" in content
+        # Should contain response post frontmatter (replies are the default response type)
+        assert "response_type: reply" in content
+        assert 'targeturl: "https://example.com/original-article"' in content
         assert "dt_published:" in content
-        assert "- response" in content
-        assert "- discussion" in content
+        assert 'tags: ["response", "discussion"]' in content
@@ -7,10 +7,22 @@ Tests the Pydantic-based configuration loading and validation.
 import pytest
 import os
 from unittest.mock import patch
-from pydantic import ValidationError
+from pydantic import SecretStr, ValidationError
 
 from discord_publish_bot.config import AppSettings, DiscordSettings, GitHubSettings, APISettings, PublishingSettings
 
+# Known-good inputs; tests that are not exercising validation build from
+# these with model_construct to skip re-running the validators. model_construct
+# does no coercion either, so secret fields must already be SecretStr.
+_VALID_DISCORD = dict(
+    bot_token=SecretStr("FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789"),
+    application_id="123456789012345678",
+    public_key="a" * 64,
+    authorized_user_id="987654321098765432"
+)
+_VALID_GITHUB = dict(token=SecretStr("ghp_test_token"), repository="user/repo")
+_VALID_API = dict(key=SecretStr("test_key_1234567890"))
+
 
 @pytest.mark.unit
 class TestConfigurationSettings:
@@ -26,7 +38,7 @@ class TestConfigurationSettings:
             authorized_user_id="987654321098765432"
         )
         
-        assert valid_settings.bot_token == "FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789"
+        assert valid_settings.bot_token.get_secret_value() == "FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789"
         assert valid_settings.application_id == "123456789012345678"
         assert valid_settings.public_key == "a" * 64
         assert valid_settings.authorized_user_id == "987654321098765432"
@@ -34,6 +46,15 @@ class TestConfigurationSettings:
         # Test validation of required fields
         with pytest.raises(ValidationError):
             DiscordSettings(bot_token="")  # Empty token should fail
+        
+        # Public key must be 64 hex characters
+        for bad_key in ("a" * 63, "g" * 64):
+            with pytest.raises(ValidationError):
+                DiscordSettings(
+                    bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
+                    public_key=bad_key,
+                    authorized_user_id="987654321098765432"
+                )
     
     def test_github_settings_validation(self):
         """Test GitHub settings validation."""
@@ -44,7 +65,7 @@ class TestConfigurationSettings:
             branch="main"
         )
         
-        assert valid_settings.token == "ghp_valid_token_12345"
+        assert valid_settings.token.get_secret_value() == "ghp_valid_token_12345"
         assert valid_settings.repository == "user/repo"
         assert valid_settings.branch == "main"
         assert valid_settings.owner == "user"
@@ -74,7 +95,7 @@ class TestConfigurationSettings:
             endpoint="https://api.example.com"
         )
         
-        assert valid_settings.key == "valid_api_key_1234567890"
+        assert valid_settings.key.get_secret_value() == "valid_api_key_1234567890"
         assert valid_settings.host == "localhost"
         assert valid_settings.port == 8000
         assert valid_settings.endpoint == "https://api.example.com"
@@ -110,50 +131,31 @@ class TestConfigurationSettings:
         with pytest.raises(ValidationError):
             PublishingSettings(site_base_url="not_a_url")
     
-    def test_app_settings_integration(self, test_env_vars):
-        """Test full application settings integration."""
-        with patch.dict(os.environ, test_env_vars, clear=True):
-            settings = AppSettings.from_env()
-            
-            assert settings.app_name == "Discord Publish Bot"
-            assert settings.version == "2.0.0"
-            assert settings.environment == "development"
-            assert settings.log_level == "DEBUG"  # From test env vars
-            
-            # Test nested settings
-            assert settings.discord.bot_token == test_env_vars["DISCORD_BOT_TOKEN"]
-            assert settings.github.repository == test_env_vars["GITHUB_REPO"]
-            assert settings.api.key == test_env_vars["API_KEY"]
-    
-    def test_environment_variable_mapping(self, test_env_vars):
-        """Test that environment variables are correctly mapped."""
-        with patch.dict(os.environ, test_env_vars, clear=True):
-            settings = AppSettings.from_env()
-            
-            # Test direct mapping
-            assert settings.environment == test_env_vars["ENVIRONMENT"]
-            assert settings.log_level == test_env_vars["LOG_LEVEL"]
-            
-            # Test nested mapping
-            assert settings.discord.bot_token == test_env_vars["DISCORD_BOT_TOKEN"]
-            assert settings.github.token == test_env_vars["GITHUB_TOKEN"]
-            assert settings.api.host == test_env_vars["API_HOST"]
+    def test_app_settings_integration(self, settings_env):
+        """Test full application settings integration and environment variable mapping."""
+        settings = AppSettings.from_env()
+        
+        assert settings.app_name == "Discord Publish Bot"
+        assert settings.version == "2.0.0"
+        
+        # Test direct mapping
+        assert settings.environment == settings_env["ENVIRONMENT"]
+        assert settings.log_level == settings_env["LOG_LEVEL"]
+        
+        # Test nested mapping
+        assert settings.discord.bot_token.get_secret_value() == settings_env["DISCORD_BOT_TOKEN"]
+        assert settings.github.token.get_secret_value() == settings_env["GITHUB_TOKEN"]
+        assert settings.github.repository == settings_env["GITHUB_REPO"]
+        assert settings.api.key.get_secret_value() == settings_env["API_KEY"]
+        assert settings.api.host == settings_env["API_HOST"]
     
     def test_default_values(self):
         """Test that default values are properly set."""
         # Create minimal settings to test defaults
-        discord_settings = DiscordSettings(
-            bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
-            application_id="123456789012345678",
-            public_key="a" * 64,
-            authorized_user_id="987654321098765432"
-        )
-        github_settings = GitHubSettings(
-            token="ghp_test_token",
-            repository="user/repo"
-        )
-        api_settings = APISettings(key="test_key_1234567890")
-        publishing_settings = PublishingSettings()
+        discord_settings = DiscordSettings.model_construct(**_VALID_DISCORD)
+        github_settings = GitHubSettings.model_construct(**_VALID_GITHUB)
+        api_settings = APISettings.model_construct(**_VALID_API)
+        publishing_settings = PublishingSettings.model_construct()
         
         app_settings = AppSettings(
             discord=discord_settings,
@@ -176,15 +178,10 @@ class TestConfigurationSettings:
         # Development environment
         dev_settings = AppSettings(
             environment="development",
-            discord=DiscordSettings(
-                bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
-                application_id="123456789012345678",
-                public_key="a" * 64,
-                authorized_user_id="987654321098765432"
-            ),
-            github=GitHubSettings(token="ghp_test", repository="user/repo"),
-            api=APISettings(key="test_key_1234567890"),
-            publishing=PublishingSettings()
+            discord=DiscordSettings.model_construct(**_VALID_DISCORD),
+            github=GitHubSettings.model_construct(**_VALID_GITHUB),
+            api=APISettings.model_construct(**_VALID_API),
+            publishing=PublishingSettings.model_construct()
         )
         
         assert dev_settings.is_development is True
@@ -193,63 +190,40 @@ class TestConfigurationSettings:
         # Production environment
         prod_settings = AppSettings(
             environment="production",
-            discord=DiscordSettings(
-                bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
-                application_id="123456789012345678",
-                public_key="a" * 64,
-                authorized_user_id="987654321098765432"
-            ),
-            github=GitHubSettings(token="ghp_test", repository="user/repo"),
-            api=APISettings(key="test_key_1234567890"),
-            publishing=PublishingSettings()
+            discord=DiscordSettings.model_construct(**_VALID_DISCORD),
+            github=GitHubSettings.model_construct(**_VALID_GITHUB),
+            api=APISettings.model_construct(**_VALID_API),
+            publishing=PublishingSettings.model_construct()
         )
         
         assert prod_settings.is_development is False
         assert prod_settings.is_production is True
     
-    def test_settings_serialization(self, test_settings):
+    def test_settings_serialization(self, test_settings_dump):
         """Test that settings can be serialized and deserialized."""
         # Test dict conversion
-        settings_dict = test_settings.model_dump()
+        settings_dict = test_settings_dump.data
         
-        assert isinstance(settings_dict, dict)
-        assert "app_name" in settings_dict
-        assert "discord" in settings_dict
-        assert "github" in settings_dict
+        assert {"app_name", "discord", "github"} <= settings_dict.keys()
         
         # Test JSON serialization
-        settings_json = test_settings.model_dump_json()
-        assert isinstance(settings_json, str)
-        assert "Discord Publish Bot" in settings_json
+        assert "Discord Publish Bot" in test_settings_dump.json
     
     def test_discord_interactions_enabled(self):
         """Test Discord interactions enabled detection."""
+        # The property only reads the Discord section, so skip building the rest
         # With HTTP interactions configured
-        settings_with_http = AppSettings(
-            discord=DiscordSettings(
-                bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
-                application_id="123456789012345678",
-                public_key="a" * 64,
-                authorized_user_id="987654321098765432"
-            ),
-            github=GitHubSettings(token="ghp_test", repository="user/repo"),
-            api=APISettings(key="test_key_1234567890"),
-            publishing=PublishingSettings()
+        settings_with_http = AppSettings.model_construct(
+            discord=DiscordSettings.model_construct(**_VALID_DISCORD)
         )
         
         assert settings_with_http.discord_interactions_enabled is True
         
         # Without HTTP interactions configured
-        settings_without_http = AppSettings(
-            discord=DiscordSettings(
-                bot_token="FAKE_TEST_TOKEN.NEVER_REAL.SAFE_FOR_TESTING_123456789",
-                application_id="123456789012345678",
-                public_key=None,  # None public key should disable HTTP interactions
-                authorized_user_id="987654321098765432"
-            ),
-            github=GitHubSettings(token="ghp_test", repository="user/repo"),
-            api=APISettings(key="test_key_1234567890"),
-            publishing=PublishingSettings()
+        settings_without_http = AppSettings.model_construct(
+            discord=DiscordSettings.model_construct(
+                **{**_VALID_DISCORD, "public_key": None}  # None public key should disable HTTP interactions
+            )
         )
         
         assert settings_without_http.discord_interactions_enabled is False
@@ -259,15 +233,14 @@ class TestConfigurationSettings:
 class TestConfigurationUtilities:
     """Test configuration utility functions."""
     
-    def test_get_settings_function(self, test_env_vars):
+    def test_get_settings_function(self, settings_env):
         """Test the get_settings utility function."""
         from discord_publish_bot.config import get_settings
         
-        with patch.dict(os.environ, test_env_vars, clear=True):
-            settings = get_settings()
-            
-            assert isinstance(settings, AppSettings)
-            assert settings.environment == "development"
+        settings = get_settings()
+        
+        assert isinstance(settings, AppSettings)
+        assert settings.environment == "development"
     
     def test_settings_caching(self):
         """Test that settings are properly cached."""
@@ -288,12 +261,12 @@ class TestConfigurationUtilities:
     
     def test_sensitive_data_handling(self, test_settings):
         """Test that sensitive data is properly handled in logs/output."""
-        # Test that sensitive fields are masked in string representation
-        settings_str = str(test_settings)
+        # Secret fields are masked in string representation and serialized output
+        for rendered in (str(test_settings), repr(test_settings), test_settings.model_dump_json()):
+            assert "FAKE_TEST_TOKEN.NEVER_REAL.OBVIOUSLY_FAKE_FOR_TESTING" not in rendered
+            assert "ghp_FAKE_TEST_TOKEN_SAFE_1234567890abcdef_NEVER_REAL" not in rendered
+            assert "test_api_key_SAFE_FAKE_1234567890abcdef_NEVER_REAL" not in rendered
+            assert "**********" in rendered
         
-        # Tokens should not appear in full in string representation
-        # Note: Current implementation shows full tokens, this is a known limitation
-        # In production, consider implementing proper masking
-        assert "FAKE_TEST_TOKEN.NEVER_REAL.OBVIOUSLY_FAKE_FOR_TESTING" in settings_str  # Currently visible
-        assert "ghp_FAKE_TEST_TOKEN_SAFE_1234567890abcdef_NEVER_REAL" in settings_str  # Currently visible  
-        assert "test_api_key_SAFE_FAKE_1234567890abcdef_NEVER_REAL" in settings_str  # Currently visible
+        # The real values stay available at the client boundary
+        assert test_settings.github.token.get_secret_value() == "ghp_FAKE_TEST_TOKEN_SAFE_1234567890abcdef_NEVER_REAL"
@@ -2,27 +2,50 @@
 Test HTTP interactions handler slug field integration for Phase 3.
 """
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 from src.discord_publish_bot.discord.interactions import DiscordInteractionsHandler
 from src.discord_publish_bot.shared.types import PostType
 
 
+def _fields_by_id(modal):
+    """Index a modal's text inputs by custom_id (one input per action row, in order)."""
+    return {row["components"][0]["custom_id"]: row["components"][0] for row in modal["components"]}
+
+
+def _make_interaction(custom_id, **field_values):
+    """Build a modal submission with one text input (type 4) per action row, in argument order."""
+    return {
+        "data": {
+            "custom_id": custom_id,
+            "components": [
+                {"components": [{"type": 4, "custom_id": field_id, "value": value}]}
+                for field_id, value in field_values.items()
+            ]
+        },
+        "user": {"id": "987654321098765432"}
+    }
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """Create interactions handler with stub settings (only the attributes the handler reads); tests only read it."""
+    settings = SimpleNamespace(
+        discord=SimpleNamespace(
+            authorized_user_id="987654321098765432",
+            public_key="f" * 64,
+        )
+    )
+    
+    # Bypass __init__ so no verify key is decoded
+    handler = DiscordInteractionsHandler.__new__(DiscordInteractionsHandler)
+    handler.settings = settings
+    handler.verify_key = None
+    return handler
+
+
 class TestHTTPInteractionsSlugSupport:
     """Test HTTP interactions handler with slug field support."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create interactions handler with mocked settings."""
-        mock_settings = Mock()
-        mock_settings.discord.authorized_user_id = "987654321098765432"
-        mock_settings.discord.public_key = "f" * 64
-        
-        with patch('src.discord_publish_bot.discord.interactions.VerifyKey'):
-            handler = DiscordInteractionsHandler.__new__(DiscordInteractionsHandler)
-            handler.settings = mock_settings
-            handler.verify_key = Mock()
-            return handler
-
     def test_modal_creation_includes_slug_field(self, handler):
         """Test that created modals include slug field."""
         # Test note modal
@@ -34,32 +57,19 @@ class TestHTTPInteractionsSlugSupport:
         assert len(modal["components"]) == 4  # Title, Content, Tags, Slug
         
         # Find slug field
-        slug_field = None
-        for component in modal["components"]:
-            text_input = component["components"][0]
-            if text_input["custom_id"] == "slug":
-                slug_field = text_input
-                break
+        slug_field = _fields_by_id(modal).get("slug")
         
         assert slug_field is not None, "Slug field should be present in modal"
         assert slug_field["label"] == "Custom Slug (optional)"
         assert slug_field["required"] is False
         assert slug_field["max_length"] == 80
 
-    def test_modal_creation_all_post_types_have_slug(self, handler):
+    @pytest.mark.parametrize("post_type", list(PostType), ids=lambda pt: pt.value)
+    def test_modal_creation_all_post_types_have_slug(self, handler, post_type):
         """Test that all post types include slug field."""
-        for post_type in PostType:
-            modal = handler._create_post_modal(post_type)
-            
-            # Find slug field
-            slug_field = None
-            for component in modal["components"]:
-                text_input = component["components"][0]
-                if text_input["custom_id"] == "slug":
-                    slug_field = text_input
-                    break
-            
-            assert slug_field is not None, f"Slug field should be present in {post_type.value} modal"
+        modal = handler._create_post_modal(post_type)
+        
+        assert "slug" in _fields_by_id(modal), f"Slug field should be present in {post_type.value} modal"
 
     def test_media_modal_has_correct_field_count(self, handler):
         """Test that media modal has correct number of fields after simplification."""
@@ -70,13 +80,8 @@ class TestHTTPInteractionsSlugSupport:
         assert len(modal["components"]) == 5
         
         # Verify field IDs
-        field_ids = []
-        for component in modal["components"]:
-            text_input = component["components"][0]
-            field_ids.append(text_input["custom_id"])
-        
         expected_fields = ["title", "content", "tags", "slug", "media_url"]
-        assert field_ids == expected_fields
+        assert list(_fields_by_id(modal)) == expected_fields
 
     def test_media_modal_with_attachment(self, handler):
         """Test media modal with attachment data."""
@@ -89,12 +94,7 @@ class TestHTTPInteractionsSlugSupport:
         modal = handler._create_post_modal(PostType.MEDIA, attachment_data=attachment_data)
         
         # Find media URL field
-        media_url_field = None
-        for component in modal["components"]:
-            text_input = component["components"][0]
-            if text_input["custom_id"] == "media_url":
-                media_url_field = text_input
-                break
+        media_url_field = _fields_by_id(modal).get("media_url")
         
         assert media_url_field is not None
         assert media_url_field["value"] == attachment_data["url"]
@@ -103,42 +103,10 @@ class TestHTTPInteractionsSlugSupport:
     def test_post_data_extraction_includes_slug(self, handler):
         """Test that PostData extraction includes slug field."""
         # Mock modal submission interaction
-        interaction = {
-            "data": {
-                "custom_id": "post_modal_note",
-                "components": [
-                    {
-                        "components": [{
-                            "type": 4,  # TEXT_INPUT
-                            "custom_id": "title",
-                            "value": "Test Post"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "content", 
-                            "value": "Test content"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "tags",
-                            "value": "test, example"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "slug",
-                            "value": "custom-test-slug"
-                        }]
-                    }
-                ]
-            },
-            "user": {"id": "987654321098765432"}
-        }
+        interaction = _make_interaction(
+            "post_modal_note",
+            title="Test Post", content="Test content", tags="test, example", slug="custom-test-slug"
+        )
         
         post_data = handler.extract_post_data_from_modal(interaction)
         
@@ -152,42 +120,10 @@ class TestHTTPInteractionsSlugSupport:
 
     def test_post_data_extraction_empty_slug(self, handler):
         """Test PostData extraction with empty slug field."""
-        interaction = {
-            "data": {
-                "custom_id": "post_modal_note",
-                "components": [
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "title",
-                            "value": "Test Post"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "content",
-                            "value": "Test content"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "tags",
-                            "value": ""
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "slug",
-                            "value": ""  # Empty slug
-                        }]
-                    }
-                ]
-            },
-            "user": {"id": "987654321098765432"}
-        }
+        interaction = _make_interaction(
+            "post_modal_note",
+            title="Test Post", content="Test content", tags="", slug=""  # Empty slug
+        )
         
         post_data = handler.extract_post_data_from_modal(interaction)
         
@@ -195,49 +131,11 @@ class TestHTTPInteractionsSlugSupport:
 
     def test_media_post_data_extraction(self, handler):
         """Test PostData extraction for media posts."""
-        interaction = {
-            "data": {
-                "custom_id": "post_modal_media",
-                "components": [
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "title",
-                            "value": "Test Media"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "content",
-                            "value": "Test media content"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "tags", 
-                            "value": "media, test"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "slug",
-                            "value": "test-media-slug"
-                        }]
-                    },
-                    {
-                        "components": [{
-                            "type": 4,
-                            "custom_id": "media_url",
-                            "value": "https://example.com/image.jpg"
-                        }]
-                    }
-                ]
-            },
-            "user": {"id": "987654321098765432"}
-        }
+        interaction = _make_interaction(
+            "post_modal_media",
+            title="Test Media", content="Test media content", tags="media, test",
+            slug="test-media-slug", media_url="https://example.com/image.jpg"
+        )
         
         post_data = handler.extract_post_data_from_modal(interaction)
         
@@ -4,7 +4,15 @@ Test modal integration and field allocation for Phase 2 validation.
 import pytest
 import inspect
 from src.discord_publish_bot.discord.bot import BasePostModal, MediaModal
-from src.discord_publish_bot.shared.types import PostType
+from src.discord_publish_bot.shared.types import PostData, PostType
+from src.discord_publish_bot.shared.utils import generate_filename
+
+# Introspect the modal classes once at import; the tests only check membership
+_BASE_INIT_PARAMS = frozenset(inspect.signature(BasePostModal.__init__).parameters)
+_MEDIA_INIT_PARAMS = frozenset(inspect.signature(MediaModal.__init__).parameters)
+_ADD_TYPE_PARAMS = frozenset(inspect.signature(MediaModal._add_type_specific_data).parameters)
+_ON_SUBMIT_PARAMS = frozenset(inspect.signature(MediaModal.on_submit).parameters)
+_MEDIA_INIT_SRC = inspect.getsource(MediaModal.__init__)
 
 
 class TestModalIntegration:
@@ -13,21 +21,15 @@ class TestModalIntegration:
     def test_base_post_modal_constructor_signature(self):
         """Test BasePostModal constructor accepts PostType parameter."""
         # Check constructor signature
-        sig = inspect.signature(BasePostModal.__init__)
-        params = list(sig.parameters.keys())
-        
-        assert 'bot' in params, "BasePostModal should accept bot parameter"
-        assert 'post_type' in params, "BasePostModal should accept post_type parameter"
+        assert 'bot' in _BASE_INIT_PARAMS, "BasePostModal should accept bot parameter"
+        assert 'post_type' in _BASE_INIT_PARAMS, "BasePostModal should accept post_type parameter"
     
     def test_media_modal_constructor_signature(self):
         """Test MediaModal constructor accepts attachment and alt_text parameters."""
         # Check constructor signature
-        sig = inspect.signature(MediaModal.__init__)
-        params = list(sig.parameters.keys())
-        
-        assert 'bot' in params, "MediaModal should accept bot parameter"
-        assert 'attachment_url' in params, "MediaModal should accept attachment_url parameter"
-        assert 'alt_text' in params, "MediaModal should accept alt_text parameter"
+        assert 'bot' in _MEDIA_INIT_PARAMS, "MediaModal should accept bot parameter"
+        assert 'attachment_url' in _MEDIA_INIT_PARAMS, "MediaModal should accept attachment_url parameter"
+        assert 'alt_text' in _MEDIA_INIT_PARAMS, "MediaModal should accept alt_text parameter"
     
     def test_media_modal_inheritance_structure(self):
         """Test MediaModal inheritance and method structure."""
@@ -36,19 +38,12 @@ class TestModalIntegration:
         assert hasattr(MediaModal, 'on_submit'), "MediaModal should have custom on_submit method"
         
         # Check method signatures
-        add_data_sig = inspect.signature(MediaModal._add_type_specific_data)
-        assert 'post_data' in add_data_sig.parameters, "_add_type_specific_data should accept post_data parameter"
-        
-        submit_sig = inspect.signature(MediaModal.on_submit)
-        assert 'interaction' in submit_sig.parameters, "on_submit should accept interaction parameter"
+        assert 'post_data' in _ADD_TYPE_PARAMS, "_add_type_specific_data should accept post_data parameter"
+        assert 'interaction' in _ON_SUBMIT_PARAMS, "on_submit should accept interaction parameter"
     
     def test_modal_field_initialization_logic(self):
         """Test modal field initialization logic by examining source code."""
-        import ast
-        import inspect
-        
-        # Get MediaModal.__init__ source code
-        source = inspect.getsource(MediaModal.__init__)
+        source = _MEDIA_INIT_SRC
         
         # Check for simplified field allocation logic
         assert 'command_alt_text' in source, "MediaModal should handle command_alt_text parameter"
@@ -64,7 +59,6 @@ class TestPostDataIntegration:
     
     def test_postdata_slug_field_exists(self):
         """Test PostData model includes slug field."""
-        from src.discord_publish_bot.shared.types import PostData
         
         # Check if slug is in the PostData model fields using Pydantic
         model_fields = PostData.model_fields
@@ -100,8 +94,6 @@ class TestUtilsIntegration:
     
     def test_generate_filename_slug_priority(self):
         """Test generate_filename prioritizes slug over title."""
-        from src.discord_publish_bot.shared.utils import generate_filename
-        from src.discord_publish_bot.shared.types import PostType
         
         # Test slug priority
         filename = generate_filename(
@@ -115,8 +107,6 @@ class TestUtilsIntegration:
     
     def test_generate_filename_fallback_to_title(self):
         """Test generate_filename falls back to title when no slug."""
-        from src.discord_publish_bot.shared.utils import generate_filename
-        from src.discord_publish_bot.shared.types import PostType
         
         # Test title fallback
         filename = generate_filename(
@@ -132,7 +122,6 @@ class TestBackwardsCompatibility:
     
     def test_postdata_backwards_compatibility(self):
         """Test PostData backwards compatibility without slug."""
-        from src.discord_publish_bot.shared.types import PostData
         
         # Old PostData creation should still work
         old_style_post = PostData(
@@ -149,8 +138,6 @@ class TestBackwardsCompatibility:
     
     def test_filename_generation_backwards_compatibility(self):
         """Test filename generation works with old-style calls."""
-        from src.discord_publish_bot.shared.utils import generate_filename
-        from src.discord_publish_bot.shared.types import PostType
         
         # Old-style filename generation
         filename = generate_filename(
@@ -4,17 +4,26 @@ Unit tests for publishing service functionality.
 Tests the publishing service with mocked GitHub client.
 """
 
+import re
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
 from discord_publish_bot.publishing.service import PublishingService
 from discord_publish_bot.publishing.github_client import GitHubClient
-from discord_publish_bot.shared import PostData, PostType, PublishResult
+from discord_publish_bot.shared import (
+    PostData, PostType, PublishResult, PublishStatus, ResponseType
+)
 from discord_publish_bot.shared.utils import (
-    generate_filename, validate_url, parse_tags, format_datetime
+    generate_filename, validate_url, parse_tags, format_datetime,
+    slugify, format_frontmatter, calculate_content_hash,
+    extract_youtube_video_id, is_youtube_url, generate_youtube_embed
 )
 
+# URL-safe markdown filename
+_FILENAME_RE = re.compile(r"[A-Za-z0-9._-]+\.md")
+
 
 @pytest.mark.unit
 class TestPublishingService:
@@ -32,7 +41,6 @@ class TestPublishingService:
         assert service.github_settings == test_settings.github
         assert service.publishing_settings == test_settings.publishing
     
-    @pytest.mark.asyncio
     async def test_publish_note_post(self, publishing_service, sample_post_data):
         """Test publishing a note post."""
         note_data = sample_post_data["note"]
@@ -40,98 +48,64 @@ class TestPublishingService:
         result = await publishing_service.publish_post(note_data)
         
         assert isinstance(result, PublishResult)
-        assert result.success is True
-        assert "successfully" in result.message.lower()
+        assert result.status is PublishStatus.SUCCESS
         assert result.site_url is not None
     
-    @pytest.mark.asyncio
-    async def test_publish_response_post(self, publishing_service, sample_post_data):
-        """Test publishing a response post."""
-        response_data = sample_post_data["response"]
-        
-        result = await publishing_service.publish_post(response_data)
-        
-        assert isinstance(result, PublishResult)
-        assert result.success is True
-        assert result.filepath.endswith("test-response.md")
-        assert "_src/responses" in result.filepath  # Responses go to responses directory
-    
-    @pytest.mark.asyncio
-    async def test_publish_bookmark_post(self, publishing_service, sample_post_data):
-        """Test publishing a bookmark post."""
-        bookmark_data = sample_post_data["bookmark"]
-        
-        result = await publishing_service.publish_post(bookmark_data)
+    @pytest.mark.parametrize("post_kind,filename,expected_dir", [
+        ("response", "test-response.md", "_src/responses"),
+        ("bookmark", "test-bookmark.md", "_src/bookmarks"),
+        ("media", "test-media-post.md", "_src/media"),
+    ])
+    async def test_publish_post_directory(
+        self, publishing_service, sample_post_data, post_kind, filename, expected_dir
+    ):
+        """Test each post type is published to its content directory."""
+        result = await publishing_service.publish_post(sample_post_data[post_kind])
         
         assert isinstance(result, PublishResult)
         assert result.success is True
-        assert result.filepath.endswith("test-bookmark.md")
-        assert "_src/responses" in result.filepath  # Bookmarks go to responses directory
+        assert result.filepath.endswith(filename)
+        assert expected_dir in result.filepath
     
-    @pytest.mark.asyncio
-    async def test_publish_media_post(self, publishing_service, sample_post_data):
-        """Test publishing a media post."""
-        media_data = sample_post_data["media"]
-        
-        result = await publishing_service.publish_post(media_data)
-        
-        assert isinstance(result, PublishResult)
-        assert result.success is True
-        assert result.filepath.endswith("test-media-post.md")
-        assert "_src/media" in result.filepath  # Media posts go to media directory
+    @pytest.fixture(scope="class")
+    def all_frontmatter(self, session_publishing_service, sample_post_data):
+        """Generate frontmatter for every sample post once for the class."""
+        return {
+            kind: session_publishing_service._generate_frontmatter(post_data)
+            for kind, post_data in sample_post_data.items()
+        }
     
-    def test_frontmatter_generation_note(self, publishing_service, sample_post_data):
-        """Test frontmatter generation for note posts."""
-        note_data = sample_post_data["note"]
-        
-        frontmatter = publishing_service._generate_frontmatter(note_data)
-        
-        assert frontmatter["title"] == note_data.title
-        assert frontmatter["post_type"] == "note"
-        assert "published_date" in frontmatter
+    @pytest.mark.parametrize("post_kind,expected,date_key", [
+        ("note", {"post_type": "note"}, "published_date"),
+        ("response", {"response_type": "reply"}, "dt_published"),
+        ("bookmark", {"response_type": "bookmark"}, "dt_published"),
+    ])
+    def test_frontmatter_generation(self, all_frontmatter, sample_post_data, post_kind, expected, date_key):
+        """Test frontmatter generation for each post type."""
+        post_data = sample_post_data[post_kind]
+        frontmatter = all_frontmatter[post_kind]
+        
+        assert frontmatter["title"] == post_data.title
+        assert {k: frontmatter.get(k) for k in expected} == expected
+        assert frontmatter[date_key].endswith(" -05:00")  # Site dates are always Eastern
         # Tags should be original tags only (no auto-additions)
-        assert frontmatter["tags"] == list(note_data.tags)
-        assert "targeturl" not in frontmatter  # Notes don't have target URLs
-    
-    def test_frontmatter_generation_response(self, publishing_service, sample_post_data):
-        """Test frontmatter generation for response posts."""
-        response_data = sample_post_data["response"]
-        
-        frontmatter = publishing_service._generate_frontmatter(response_data)
-        
-        assert frontmatter["title"] == response_data.title
-        assert frontmatter["response_type"] == "reply"
-        assert "dt_published" in frontmatter
-        assert frontmatter["targeturl"] == response_data.target_url
-        assert frontmatter["tags"] == response_data.tags
+        assert frontmatter["tags"] == list(post_data.tags)
+        if post_data.target_url is None:
+            assert "targeturl" not in frontmatter  # Notes don't have target URLs
+        else:
+            assert frontmatter["targeturl"] == post_data.target_url
     
-    def test_frontmatter_generation_bookmark(self, publishing_service, sample_post_data):
-        """Test frontmatter generation for bookmark posts."""
-        bookmark_data = sample_post_data["bookmark"]
-        
-        frontmatter = publishing_service._generate_frontmatter(bookmark_data)
-        
-        assert frontmatter["title"] == bookmark_data.title
-        assert frontmatter["response_type"] == "bookmark"
-        assert "dt_published" in frontmatter
-        assert frontmatter["targeturl"] == bookmark_data.target_url
-        assert frontmatter["tags"] == bookmark_data.tags
-    
-    def test_filename_generation(self, publishing_service, sample_post_data):
+    def test_filename_generation(self, sample_post_data):
         """Test filename generation for different post types."""
         for post_type, post_data in sample_post_data.items():
             filename = generate_filename(
                 post_type=post_data.post_type,
-                title=post_data.title,
-                timestamp=datetime.now()
+                title=post_data.title
             )
             
-            assert filename.endswith(".md")
-            assert len(filename) > 10  # Should have reasonable length
-            
-            # Filename should be URL-safe
-            assert " " not in filename
-            assert all(c.isalnum() or c in "-_." for c in filename)
+            # Filename should be a URL-safe .md name of reasonable length
+            assert _FILENAME_RE.fullmatch(filename), filename
+            assert len(filename) > 10
     
     def test_content_formatting(self, publishing_service, sample_post_data):
         """Test markdown content formatting."""
@@ -145,7 +119,6 @@ class TestPublishingService:
         # Should preserve markdown formatting
         assert "\n" in formatted_content or len(formatted_content.strip()) > 0
     
-    @pytest.mark.asyncio
     async def test_error_handling_github_failure(self, test_settings, sample_post_data):
         """Test error handling when GitHub operations fail."""
         # Create a mock GitHub client that fails
@@ -161,84 +134,58 @@ class TestPublishingService:
         note_data = sample_post_data["note"]
         result = await service.publish_post(note_data)
         
-        assert result.success is False
-        assert "error" in result.message.lower()
+        assert result.status is PublishStatus.FAILED
+        assert result.error_code == "PUBLISHING_FAILED"
     
-    def test_tag_validation_and_cleanup(self, publishing_service):
+    @pytest.mark.parametrize("input_tags,expected_tags", [
+        (["valid", "tags"], ["valid", "tags"]),
+        (["tag with spaces", "another-tag"], ["tag with spaces", "another-tag"]),
+        (["", "valid-tag", ""], ["valid-tag"]),  # Empty tags filtered
+        ([], []),  # Empty list handled
+    ], ids=["plain", "spaces", "empty-entries", "empty-list"])
+    def test_tag_validation_and_cleanup(self, input_tags, expected_tags):
         """Test tag validation and cleanup."""
-        test_cases = [
-            (["valid", "tags"], ["valid", "tags"]),
-            (["tag with spaces", "another-tag"], ["tag with spaces", "another-tag"]),
-            (["", "valid-tag", ""], ["valid-tag"]),  # Empty tags filtered
-            ([], []),  # Empty list handled
-        ]
+        PostData(
+            title="Test Post",
+            content="Test content",
+            post_type=PostType.NOTE,
+            tags=input_tags
+        )
         
-        for input_tags, expected_tags in test_cases:
-            post_data = PostData(
-                title="Test Post",
-                content="Test content",
-                post_type=PostType.NOTE,
-                tags=input_tags
-            )
-            
-            cleaned_tags = parse_tags(",".join(input_tags) if input_tags else "")
-            assert cleaned_tags == expected_tags
+        cleaned_tags = parse_tags(",".join(input_tags) if input_tags else "")
+        assert cleaned_tags == expected_tags
     
-    def test_url_validation(self, publishing_service):
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com", True),
+        ("https://blog.example.com/post/123", True),
+        ("http://localhost:3000/test", True),
+        ("not-a-url", False),
+        ("", False),
+        (None, False),
+    ], ids=["https", "https-path", "http-localhost", "no-scheme", "empty", "none"])
+    def test_url_validation(self, url, expected):
         """Test URL validation for target URLs and media URLs."""
-        valid_urls = [
-            "https://example.com",
-            "https://blog.example.com/post/123",
-            "http://localhost:3000/test",
-        ]
-        
-        invalid_urls = [
-            "not-a-url",
-            "",
-            None
-        ]
-        
-        for url in valid_urls:
-            assert validate_url(url) is True
-        
-        for url in invalid_urls:
-            assert validate_url(url or "") is False
+        assert validate_url(url) is expected
     
-    @pytest.mark.asyncio
-    async def test_duplicate_post_handling(self, publishing_service, sample_post_data):
+    async def test_duplicate_post_handling(self, publishing_service, sample_post_data, monkeypatch):
         """Test handling of duplicate posts."""
         note_data = sample_post_data["note"]
         
         # Mock GitHub client to simulate file already exists
-        publishing_service.github_client.create_file.side_effect = Exception("File already exists")
+        monkeypatch.setattr(
+            publishing_service.github_client.create_file, "side_effect", Exception("File already exists")
+        )
         
         result = await publishing_service.publish_post(note_data)
         
         # Should handle gracefully (either success with different filename or clear error)
         assert isinstance(result, PublishResult)
     
-    def test_content_length_validation(self, publishing_service):
+    def test_content_length_validation(self, session_publishing_service, short_post, long_post):
         """Test content length validation."""
-        # Very short content
-        short_post = PostData(
-            title="Short",
-            content="Hi",
-            post_type=PostType.NOTE,
-            tags=["test"]
-        )
-        
-        # Very long content
-        long_content = "This is a very long post. " * 1000  # ~27,000 characters
-        long_post = PostData(
-            title="Long Post",
-            content=long_content,
-            post_type=PostType.NOTE,
-            tags=["test"]
-        )
-        
         # Both should be valid (service should handle various lengths)
-        short_frontmatter = publishing_service._generate_frontmatter(short_post)
-        long_frontmatter = publishing_service._generate_frontmatter(long_post)
+        short_frontmatter = session_publishing_service._generate_frontmatter(short_post)
+        long_frontmatter = session_publishing_service._generate_frontmatter(long_post)
         
         assert short_frontmatter["title"] == "Short"
         assert long_frontmatter["title"] == "Long Post"
@@ -248,40 +195,32 @@ class TestPublishingService:
 class TestPublishingUtilities:
     """Test publishing utility functions."""
     
-    def test_slugify_function(self):
+    @pytest.mark.parametrize("input_title,expected_slug", [
+        ("Simple Title", "simple-title"),
+        ("Title with Special Characters!", "title-with-special-characters"),
+        ("Multiple   Spaces", "multiple-spaces"),
+        ("Numbers 123 and Symbols @#$", "numbers-123-and-symbols"),
+        ("", ""),  # Empty string
+        ("Already-Slugified-Title", "already-slugified-title"),
+    ], ids=["simple", "special-chars", "multiple-spaces", "numbers-symbols", "empty", "already-slugified"])
+    def test_slugify_function(self, input_title, expected_slug):
         """Test the slugify utility function."""
-        from discord_publish_bot.shared.utils import slugify
-        
-        test_cases = [
-            ("Simple Title", "simple-title"),
-            ("Title with Special Characters!", "title-with-special-characters"),
-            ("Multiple   Spaces", "multiple-spaces"),
-            ("Numbers 123 and Symbols @#$", "numbers-123-and-symbols"),
-            ("", ""),  # Empty string
-            ("Already-Slugified-Title", "already-slugified-title"),
-        ]
         
-        for input_title, expected_slug in test_cases:
-            result = slugify(input_title)
-            assert result == expected_slug, f"Failed for '{input_title}'"
+        assert slugify(input_title) == expected_slug
     
-    def test_datetime_formatting(self):
+    @pytest.mark.parametrize("format_str,expected", [
+        ("%Y-%m-%dT%H:%M:%S", "2025-08-09T12:30:45"),  # ISO format
+        ("%Y-%m-%d", "2025-08-09"),  # Date only
+        ("%Y-%m-%d %H:%M", "2025-08-09 12:30"),  # Frontmatter date prefix
+    ])
+    def test_datetime_formatting(self, format_str, expected):
         """Test datetime formatting for frontmatter."""
-        from discord_publish_bot.shared.utils import format_datetime
-        
         test_datetime = datetime(2025, 8, 9, 12, 30, 45)
         
-        # Test ISO format
-        iso_formatted = format_datetime(test_datetime, format_str="%Y-%m-%dT%H:%M:%S")
-        assert "2025-08-09T12:30:45" in iso_formatted
-        
-        # Test date only
-        date_formatted = format_datetime(test_datetime, format_str="%Y-%m-%d")
-        assert date_formatted == "2025-08-09"
+        assert format_datetime(test_datetime, format_str=format_str) == expected
     
     def test_frontmatter_serialization(self):
         """Test frontmatter serialization to YAML."""
-        from discord_publish_bot.shared.utils import format_frontmatter
         
         frontmatter_dict = {
             "title": "Test Post",
@@ -299,7 +238,6 @@ class TestPublishingUtilities:
     
     def test_content_hash_generation(self):
         """Test content hash generation for duplicate detection."""
-        from discord_publish_bot.shared.utils import calculate_content_hash
         
         content1 = "This is test content"
         content2 = "This is test content"
@@ -315,9 +253,6 @@ class TestPublishingUtilities:
 
     def test_youtube_url_detection(self):
         """Test YouTube URL detection and video ID extraction."""
-        from discord_publish_bot.shared.utils import (
-            extract_youtube_video_id, is_youtube_url, generate_youtube_embed
-        )
         
         # Test various YouTube URL formats
         test_urls = [
@@ -340,7 +275,6 @@ class TestPublishingUtilities:
 
     def test_youtube_embed_generation(self):
         """Test YouTube embed markdown generation."""
-        from discord_publish_bot.shared.utils import generate_youtube_embed
         
         url = "https://www.youtube.com/watch?v=AtR1yVmCCvw"
         title = "Test Video Title"
@@ -357,10 +291,8 @@ class TestPublishingUtilities:
         non_youtube_embed = generate_youtube_embed("https://example.com", "Test")
         assert non_youtube_embed is None
 
-    @pytest.mark.asyncio
     async def test_youtube_response_post_enhancement(self, publishing_service, test_settings):
         """Test that response posts with YouTube URLs get automatic embed generation."""
-        from discord_publish_bot.shared import PostData, PostType, ResponseType
         
         # Create response post data with YouTube URL
         youtube_post_data = PostData(
@@ -387,10 +319,8 @@ class TestPublishingUtilities:
         assert "https://www.youtube.com/watch?v=AtR1yVmCCvw" in file_content
         assert "This video is amazing!" in file_content  # Original content should be preserved
 
-    @pytest.mark.asyncio
     async def test_non_youtube_response_post_unchanged(self, publishing_service, test_settings):
         """Test that response posts with non-YouTube URLs are not modified."""
-        from discord_publish_bot.shared import PostData, PostType, ResponseType
         
         # Create response post data with non-YouTube URL
         regular_post_data = PostData(
@@ -7,7 +7,7 @@ Tests the enhanced generate_filename function with slug priority logic.
 import pytest
 from datetime import datetime
 
-from src.discord_publish_bot.shared.types import PostType
+from src.discord_publish_bot.shared.types import PostData, PostType
 from src.discord_publish_bot.shared.utils import generate_filename, slugify
 
 
@@ -23,29 +23,13 @@ class TestSlugGeneration:
         )
         assert filename == "custom-short-slug.md"
 
-    def test_slug_fallback_to_title(self):
+    @pytest.mark.parametrize("slug", [None, "", "   "], ids=["none", "empty", "whitespace"])
+    def test_slug_fallback_to_title(self, slug):
         """Test fallback to title when slug is empty or None."""
-        # Test with None slug
         filename = generate_filename(
             post_type=PostType.NOTE,
             title="Test Title",
-            slug=None
-        )
-        assert filename == "test-title.md"
-        
-        # Test with empty slug
-        filename = generate_filename(
-            post_type=PostType.NOTE,
-            title="Test Title",
-            slug=""
-        )
-        assert filename == "test-title.md"
-        
-        # Test with whitespace-only slug
-        filename = generate_filename(
-            post_type=PostType.NOTE,
-            title="Test Title",
-            slug="   "
+            slug=slug
         )
         assert filename == "test-title.md"
 
@@ -67,26 +51,22 @@ class TestSlugGeneration:
             slug=very_long_slug
         )
         # Should be truncated to 80 characters + .md
-        assert len(filename) == 83  # 80 + ".md"
-        assert filename.endswith(".md")
-        assert filename.startswith("a")
-
-    def test_slug_with_different_post_types(self):
+        assert filename == "a" * 80 + ".md"
+
+    @pytest.mark.parametrize("post_type,expected_slug", [
+        (PostType.NOTE, "note-slug"),
+        (PostType.RESPONSE, "response-slug"),
+        (PostType.BOOKMARK, "bookmark-slug"),
+        (PostType.MEDIA, "media-slug"),
+    ], ids=["note", "response", "bookmark", "media"])
+    def test_slug_with_different_post_types(self, post_type, expected_slug):
         """Test slug generation works with all post types."""
-        test_cases = [
-            (PostType.NOTE, "note-slug"),
-            (PostType.RESPONSE, "response-slug"),
-            (PostType.BOOKMARK, "bookmark-slug"),
-            (PostType.MEDIA, "media-slug"),
-        ]
-        
-        for post_type, expected_slug in test_cases:
-            filename = generate_filename(
-                post_type=post_type,
-                title="Test Title",
-                slug=expected_slug
-            )
-            assert filename == f"{expected_slug}.md"
+        filename = generate_filename(
+            post_type=post_type,
+            title="Test Title",
+            slug=expected_slug
+        )
+        assert filename == f"{expected_slug}.md"
 
     def test_backwards_compatibility(self):
         """Test that existing code calling without slug parameter still works."""
@@ -97,12 +77,13 @@ class TestSlugGeneration:
         )
         assert filename == "test-title.md"
         
-        # Test with timestamp parameter (should be ignored)
-        filename = generate_filename(
-            post_type=PostType.NOTE,
-            title="Test Title",
-            timestamp=datetime.now()
-        )
+        # Test with timestamp parameter (ignored, but flagged as deprecated)
+        with pytest.warns(DeprecationWarning, match="timestamp"):
+            filename = generate_filename(
+                post_type=PostType.NOTE,
+                title="Test Title",
+                timestamp=datetime.now()
+            )
         assert filename == "test-title.md"
 
     def test_unicode_slug_handling(self):
@@ -115,34 +96,22 @@ class TestSlugGeneration:
         # Unicode should be normalized and special chars removed
         assert filename == "cafe-resume-with-unicode.md"
 
-    def test_edge_cases(self):
-        """Test various edge cases for slug generation."""
-        # Slug with only special characters
-        filename = generate_filename(
-            post_type=PostType.NOTE,
-            title="Fallback Title",
-            slug="!@#$%^&*()"
-        )
-        # Should fall back to title since slug becomes empty after sanitization
-        assert filename == "fallback-title.md"
-        
+    @pytest.mark.parametrize("title,slug,expected", [
+        # Slug with only special characters falls back to the title
+        ("Fallback Title", "!@#$%^&*()", "fallback-title.md"),
         # Slug with numbers and hyphens
+        ("Test Title", "test-123-slug-456", "test-123-slug-456.md"),
+        # Slugify should remove leading/trailing hyphens
+        ("Test Title", "-hyphen-test-", "hyphen-test.md"),
+    ], ids=["special-only", "numbers-and-hyphens", "edge-hyphens"])
+    def test_edge_cases(self, title, slug, expected):
+        """Test various edge cases for slug generation."""
         filename = generate_filename(
             post_type=PostType.NOTE,
-            title="Test Title",
-            slug="test-123-slug-456"
-        )
-        assert filename == "test-123-slug-456.md"
-        
-        # Slug that starts/ends with hyphens
-        filename = generate_filename(
-            post_type=PostType.NOTE,
-            title="Test Title",
-            slug="-hyphen-test-"
+            title=title,
+            slug=slug
         )
-        # Slugify should remove leading/trailing hyphens
-        assert filename == "hyphen-test.md"
-
+        assert filename == expected
 
 class TestSlugifyFunction:
     """Test the slugify utility function that supports slug generation."""
@@ -195,8 +164,6 @@ class TestSlugIntegration:
 
     def test_postdata_slug_field(self):
         """Test that PostData model accepts slug field."""
-        from src.discord_publish_bot.shared.types import PostData
-        
         post_data = PostData(
             title="Test Title",
             content="Test content",
@@ -209,8 +176,6 @@ class TestSlugIntegration:
 
     def test_postdata_optional_slug(self):
         """Test that slug field is optional in PostData."""
-        from src.discord_publish_bot.shared.types import PostData
-        
         post_data = PostData(
             title="Test Title",
             content="Test content",
@@ -222,8 +187,6 @@ class TestSlugIntegration:
 
     def test_filename_generation_with_postdata(self):
         """Test filename generation using data from PostData model."""
-        from src.discord_publish_bot.shared.types import PostData
-        
         # Test with custom slug
         post_data = PostData(
             title="Original Title",